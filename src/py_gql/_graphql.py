@@ -1,8 +1,31 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, Union, cast
+import asyncio
+import copy
+import functools
+import hashlib
+import json
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
-from .exc import ExecutionError, GraphQLSyntaxError, VariablesCoercionError
+from ._utils import LRUCache
+from .exc import (
+    ExecutionError,
+    GraphQLSyntaxError,
+    PersistedQueryNotFound,
+    VariablesCoercionError,
+)
 from .execution import (
     BlockingExecutor,
     Executor,
@@ -12,14 +35,216 @@ from .execution import (
 )
 from .execution.runtime import AsyncIORuntime, BlockingRuntime, Runtime
 from .lang import parse
-from .lang.ast import Document
+from .lang.ast import Document, OperationDefinition
 from .schema import Schema
-from .validation import Validator, validate_ast
+from .validation import ValidationResult, Validator, validate_ast
+
+
+# Cache lookups go through a single `LRUCache.get` call with this sentinel as
+# the default rather than `in` followed by `get` which could race with
+# concurrent evictions.
+_UNSET = object()
+
+
+# Parsing is a pure function of the source string so identical documents can
+# share the same AST. This assumes the AST is not modified during validation
+# and execution which is the case for the default validators and executors.
+#
+# Documents are keyed by their source rather than a digest: str hashes are
+# computed once per string object and lookups compare the full source, so
+# hash collisions can never return the wrong document.
+@functools.lru_cache(maxsize=1000)
+def _parse_or_error(document: str) -> Union[Document, GraphQLSyntaxError]:
+    # Syntax errors are returned rather than raised so that they get cached as
+    # well and repeated invalid documents do not hit the parser again.
+    try:
+        return parse(document)
+    except GraphQLSyntaxError as err:
+        # Do not keep the parser's frames alive for as long as the error is
+        # cached.
+        return err.with_traceback(None)
+
+
+# Maps (schema, schema version, document, validators) to validation results.
+# Keys hold references to the schema and document which guarantees they won't
+# be garbage collected and their ids re-used while cached.
+#
+# Failed validations are kept in a separate, smaller cache so that bursts of
+# invalid queries are cheap to reject but cannot evict valid documents.
+_validation_cache = LRUCache(maxsize=1000)
+_validation_error_cache = LRUCache(maxsize=256)
+
+
+def _cached_validate(
+    schema: Schema,
+    document: Document,
+    validators: Optional[Sequence[Validator]] = None,
+) -> ValidationResult:
+    # Freezing custom validators once makes them usable in the cache key and
+    # as is by `validate_ast`; `None` selects the default validators.
+    frozen_validators = tuple(validators) if validators is not None else None
+    key = (
+        schema,
+        schema._version,
+        document,
+        frozen_validators,
+    )  # type: Hashable
+
+    try:
+        cached = _validation_cache.get(key, _UNSET)
+    except TypeError:  # Unhashable custom validators.
+        return validate_ast(schema, document, validators=frozen_validators)
+
+    if cached is _UNSET:
+        cached = _validation_error_cache.get(key, _UNSET)
+
+    if cached is not _UNSET:
+        return cast(ValidationResult, cached)
+
+    result = validate_ast(schema, document, validators=frozen_validators)
+    if result.errors:
+        _validation_error_cache[key] = result
+    else:
+        _validation_cache[key] = result
+    return result
+
+
+# Maps (schema, schema version, document source, validators) to the parsed
+# document once it has been successfully validated. This lets repeated string
+# queries skip straight to execution with a single cache lookup instead of
+# going through schema validation, parsing and document validation.
+_prepared_documents = LRUCache(maxsize=1000)
+
+
+# Maps sha256 hex digests to their parsed document. Entries are only added
+# when a client provides both the document and its hash.
+_persisted_queries = LRUCache(maxsize=1000)
+
+
+# Maps coalescing keys to the future of the first in-flight execution of an
+# identical query, see `graphql`.
+_inflight = {}  # type: Dict[Hashable, asyncio.Future[GraphQLResult]]
+
+
+def _coalescing_key(
+    schema: Schema,
+    document: Optional[Union[str, Document]],
+    variables: Optional[Mapping[str, Any]],
+    operation_name: Optional[str],
+    validators: Optional[Sequence[Validator]],
+    persisted_query_hash: Optional[str],
+) -> Optional[Hashable]:
+    # Returns ``None`` for anything which isn't safe to coalesce.
+    if isinstance(document, str):
+        parsed = _parse_or_error(document)
+        if isinstance(parsed, GraphQLSyntaxError):
+            return None
+    elif isinstance(document, Document):
+        parsed = document
+    else:
+        return None
+
+    # Mutations and subscriptions have side effects and must always run.
+    if any(
+        isinstance(definition, OperationDefinition)
+        and definition.operation != "query"
+        for definition in parsed.definitions
+    ):
+        return None
+
+    try:
+        encoded_variables = json.dumps(variables, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+    key = (
+        asyncio.get_event_loop(),
+        schema,
+        schema._version,
+        document,
+        encoded_variables,
+        operation_name,
+        tuple(validators) if validators is not None else None,
+        persisted_query_hash,
+    )  # type: Hashable
+
+    try:
+        hash(key)
+    except TypeError:  # Unhashable custom validators.
+        return None
+
+    return key
+
+
+# The following are module level functions rather than closures inside
+# `process_graphql_query` to avoid allocating them on every query and so they
+# compile to plain C functions when cythonized.
+def _on_query_end(
+    instrumentation: Instrumentation, result: GraphQLResult
+) -> GraphQLResult:
+    instrumentation.on_query_end()
+    return result
+
+
+def _abort(
+    runtime: Runtime, instrumentation: Instrumentation, result: GraphQLResult
+) -> Any:
+    # Make sure the value is wrapped similarly to the execution result to
+    # make it easier for consumers.
+    return runtime.ensure_wrapped(_on_query_end(instrumentation, result))
+
+
+def _lookup_prepared_document(
+    schema: Schema,
+    document: Optional[Union[str, Document]],
+    validators: Optional[Sequence[Validator]],
+    persisted_query_hash: Optional[str],
+) -> Tuple[Optional[Hashable], Optional[Document]]:
+    # Returns the cache key to store the document under once validated (if
+    # it can be cached) and the previously prepared document if any.
+    if not isinstance(document, str) or persisted_query_hash is not None:
+        return None, None
+
+    key = (
+        schema,
+        schema._version,
+        document,
+        tuple(validators) if validators is not None else None,
+    )  # type: Hashable
+    try:
+        prepared = _prepared_documents.get(key, _UNSET)
+    except TypeError:  # Unhashable custom validators.
+        return None, None
+    return key, (None if prepared is _UNSET else prepared)
+
+
+def _lookup_persisted_query(
+    document: Optional[Union[str, Document]],
+    persisted_query_hash: Optional[str],
+) -> Union[str, Document, GraphQLResult]:
+    # Returns the document to process or the result to abort with.
+    if document is None:
+        ast = _persisted_queries.get(persisted_query_hash, _UNSET)
+        if ast is _UNSET:
+            return GraphQLResult(errors=[PersistedQueryNotFound()])
+        return cast(Document, ast)
+
+    if (
+        isinstance(document, str)
+        and persisted_query_hash is not None
+        and hashlib.sha256(document.encode("utf8")).hexdigest()
+        != persisted_query_hash
+    ):
+        return GraphQLResult(
+            errors=[ExecutionError("Provided sha does not match query")]
+        )
+
+    return document
 
 
 def process_graphql_query(
     schema: Schema,
-    document: Union[str, Document],
+    document: Optional[Union[str, Document]],
     *,
     variables: Optional[Mapping[str, Any]] = None,
     operation_name: Optional[str] = None,
@@ -30,7 +255,8 @@ def process_graphql_query(
     instrumentation: Optional[Instrumentation] = None,
     disable_introspection: bool = False,
     runtime: Optional[Runtime] = None,
-    executor_cls: Type[Executor] = Executor
+    executor_cls: Type[Executor] = Executor,
+    persisted_query_hash: Optional[str] = None
 ) -> Any:
     """
     Execute a GraphQL query.
@@ -47,6 +273,7 @@ def process_graphql_query(
     Args:
         schema: Schema to execute the query against.
         document: The query document.
+            Can be ``None`` when ``persisted_query_hash`` is set.
         variables: Raw, JSON decoded variables parsed from the request.
         operation_name: Operation to execute
             If specified, the operation with the given name will be executed.
@@ -79,73 +306,113 @@ def process_graphql_query(
             The executor class defines the implementation of the GraphQL
             resolution algorithm. This **must** be a subclass of
             `py_gql.execution.Executor`.
+        persisted_query_hash: SHA-256 hex digest of the document.
+            When provided alongside a string document, the parsed document is
+            stored under that hash and later requests can omit the document.
+            When provided without a document and the hash is unknown, the
+            result will contain a :class:`~py_gql.exc.PersistedQueryNotFound`
+            error signaling the client to retry with the full document.
 
     Returns:
         Execution result.
 
     """
-    schema.validate()
+    # Checked before any instrumentation hook is called so that they stay
+    # balanced.
+    if document is None and persisted_query_hash is None:
+        raise ValueError("Expected either a document or a persisted hash.")
 
     instrumentation = instrumentation or Instrumentation()
     runtime = runtime or BlockingRuntime()
 
-    instrumentation.on_query_start()
+    prepared_key, prepared = _lookup_prepared_document(
+        schema, document, validators, persisted_query_hash
+    )
 
-    def _abort(*args, **kwargs):
-        # Make sure the value is wrapped similarly to the execution result to
-        # make it easier for consumers.
-        return cast(Runtime, runtime).ensure_wrapped(
-            _on_end(GraphQLResult(*args, **kwargs))
-        )
+    # A prepared document implies the schema was valid at its current version.
+    if prepared is None:
+        schema.validate()
 
-    def _on_end(result: GraphQLResult) -> GraphQLResult:
-        cast(Instrumentation, instrumentation).on_query_end()
-        return result
+    instrumentation.on_query_start()
 
-    if isinstance(document, str):
+    if prepared is not None:
+        # Keep the instrumentation hooks consistent with uncached queries.
         instrumentation.on_parsing_start()
-        try:
-            ast = parse(document)
-        except GraphQLSyntaxError as err:
-            return _abort(errors=[err])
-        finally:
-            instrumentation.on_parsing_end()
+        instrumentation.on_parsing_end()
+        instrumentation.on_validation_start()
+        instrumentation.on_validation_end()
+        ast = prepared
     else:
-        ast = document
+        source = _lookup_persisted_query(document, persisted_query_hash)
+        if isinstance(source, GraphQLResult):
+            return _abort(runtime, instrumentation, source)
 
-    instrumentation.on_validation_start()
-    validation_result = validate_ast(schema, ast, validators=validators)
-    instrumentation.on_validation_end()
+        if isinstance(source, str):
+            instrumentation.on_parsing_start()
+            try:
+                parsed = _parse_or_error(source)
+            finally:
+                instrumentation.on_parsing_end()
 
-    if not validation_result:
-        return _abort(errors=validation_result.errors)
+            if isinstance(parsed, GraphQLSyntaxError):
+                return _abort(
+                    runtime, instrumentation, GraphQLResult(errors=[parsed])
+                )
+
+            ast = parsed
+
+            if persisted_query_hash is not None:
+                _persisted_queries[persisted_query_hash] = ast
+        else:
+            ast = source
+
+        instrumentation.on_validation_start()
+        validation_result = _cached_validate(schema, ast, validators)
+        instrumentation.on_validation_end()
+
+        if validation_result.errors:
+            return _abort(
+                runtime,
+                instrumentation,
+                GraphQLResult(errors=validation_result.errors),
+            )
+
+        if prepared_key is not None:
+            _prepared_documents[prepared_key] = ast
 
     try:
-        return runtime.map_value(
-            execute(
-                schema,
-                ast,
-                operation_name=operation_name,
-                variables=variables,
-                initial_value=root,
-                context_value=context,
-                instrumentation=instrumentation,
-                middlewares=middlewares,
-                disable_introspection=disable_introspection,
-                executor_cls=executor_cls,
-                runtime=runtime,
-            ),
-            _on_end,
+        result = execute(
+            schema,
+            ast,
+            operation_name=operation_name,
+            variables=variables,
+            initial_value=root,
+            context_value=context,
+            instrumentation=instrumentation,
+            middlewares=middlewares,
+            disable_introspection=disable_introspection,
+            executor_cls=executor_cls,
+            runtime=runtime,
         )
     except VariablesCoercionError as err:
-        return _abort(data=None, errors=err.errors)
+        return _abort(
+            runtime,
+            instrumentation,
+            GraphQLResult(data=None, errors=err.errors),
+        )
     except ExecutionError as err:
-        return _abort(data=None, errors=[err])
+        return _abort(
+            runtime, instrumentation, GraphQLResult(data=None, errors=[err])
+        )
+
+    return runtime.map_value(
+        result, functools.partial(_on_query_end, instrumentation)
+    )
 
 
 async def graphql(
     schema: Schema,
-    document: Union[str, Document],
+    document: Optional[Union[str, Document]],
     *,
     variables: Optional[Mapping[str, Any]] = None,
     operation_name: Optional[str] = None,
@@ -153,7 +420,9 @@ async def graphql(
     context: Any = None,
     validators: Optional[Sequence[Validator]] = None,
     middlewares: Optional[Sequence[Callable[..., Any]]] = None,
-    instrumentation: Optional[Instrumentation] = None
+    instrumentation: Optional[Instrumentation] = None,
+    persisted_query_hash: Optional[str] = None,
+    coalesce: bool = False
 ) -> GraphQLResult:
     """
     Execute a GraphQL query on the AsyncIO runtime.
@@ -161,30 +430,99 @@ async def graphql(
     This is a wrapper around :func:`~py_gql.process_graphql_query` enforcing
     usage of :class:`~py_gql.execution.runtime.AsyncIORuntime`.
 
+    Set ``coalesce`` to ``True`` to share the execution of concurrent
+    identical queries: callers providing the same schema, document,
+    variables, operation name, validators and persisted query hash while a
+    first call is still in flight will wait for and receive a copy of its
+    result instead of executing the query themselves. Only documents containing no mutation or subscription
+    are coalesced.
+
     Warning:
         Blocking (non async) resolvers will block the current thread.
 
+    Warning:
+        Coalesced calls do not execute their own ``root``, ``context``,
+        ``middlewares`` or ``instrumentation``, so only enable
+        coalescing when the result does not depend on them (e.g. public data
+        which does not depend on the current user).
+
     """
-    return cast(
-        GraphQLResult,
-        await process_graphql_query(
+    key = (
+        _coalescing_key(
             schema,
             document,
-            variables=variables,
-            operation_name=operation_name,
-            root=root,
-            validators=validators,
-            context=context,
-            instrumentation=instrumentation,
-            middlewares=middlewares,
-            runtime=AsyncIORuntime(),
-        ),
+            variables,
+            operation_name,
+            validators,
+            persisted_query_hash,
+        )
+        if coalesce
+        else None
     )
 
+    kwargs = dict(
+        variables=variables,
+        operation_name=operation_name,
+        root=root,
+        validators=validators,
+        context=context,
+        instrumentation=instrumentation,
+        middlewares=middlewares,
+        persisted_query_hash=persisted_query_hash,
+    )
+
+    if key is None:
+        return await _graphql(schema, document, **kwargs)
+
+    leader = False
+    shared = _inflight.get(key)
+    if shared is None:
+        # The shared execution runs as its own task so that it isn't tied to
+        # the caller which started it.
+        shared = asyncio.ensure_future(_graphql(schema, document, **kwargs))
+        shared.add_done_callback(functools.partial(_discard_inflight, key))
+        _inflight[key] = shared
+        leader = True
+
+    # Shield the shared task so that cancelling one of the waiting callers
+    # (including the one which started it) doesn't cancel it for the others.
+    result = await asyncio.shield(shared)  # type: GraphQLResult
+    if leader:
+        return result
+    # Results are mutable (e.g. `add_extension` or the data itself) so every
+    # other caller gets its own copy.
+    return GraphQLResult(data=copy.deepcopy(result.data), errors=result.errors)
+
+
+def _discard_inflight(
+    key: Hashable, future: "asyncio.Future[GraphQLResult]"
+) -> None:
+    if _inflight.get(key) is future:
+        del _inflight[key]
+    if not future.cancelled():
+        # Mark the exception as retrieved in case nobody was waiting.
+        future.exception()
+
+
+async def _graphql(
+    schema: Schema, document: Optional[Union[str, Document]], **kwargs: Any
+) -> GraphQLResult:
+    # Typed assignment rather than `cast` which is a function call at runtime.
+    result = await process_graphql_query(
+        schema, document, runtime=AsyncIORuntime(), **kwargs
+    )  # type: GraphQLResult
+    return result
+
+
+# `BlockingExecutor` is bound once here rather than passed on every call.
+_process_graphql_query_blocking = functools.partial(
+    process_graphql_query, executor_cls=BlockingExecutor
+)
+
 
 def graphql_blocking(
     schema: Schema,
-    document: Union[str, Document],
+    document: Optional[Union[str, Document]],
     *,
     variables: Optional[Mapping[str, Any]] = None,
     operation_name: Optional[str] = None,
@@ -192,7 +530,8 @@ def graphql_blocking(
     context: Any = None,
     validators: Optional[Sequence[Validator]] = None,
     middlewares: Optional[Sequence[Callable[..., Any]]] = None,
-    instrumentation: Optional[Instrumentation] = None
+    instrumentation: Optional[Instrumentation] = None,
+    persisted_query_hash: Optional[str] = None
 ) -> GraphQLResult:
     """
     Execute a GraphQL query in the current thread.
@@ -201,18 +540,16 @@ def graphql_blocking(
     resolvers. This uses an optimized :class:`~py_gql.execution.Executor`
     subclass.
     """
-    return cast(
-        GraphQLResult,
-        process_graphql_query(
-            schema,
-            document,
-            variables=variables,
-            operation_name=operation_name,
-            root=root,
-            validators=validators,
-            context=context,
-            instrumentation=instrumentation,
-            middlewares=middlewares,
-            executor_cls=BlockingExecutor,
-        ),
-    )
+    result = _process_graphql_query_blocking(
+        schema,
+        document,
+        variables=variables,
+        operation_name=operation_name,
+        root=root,
+        validators=validators,
+        context=context,
+        instrumentation=instrumentation,
+        middlewares=middlewares,
+        persisted_query_hash=persisted_query_hash,
+    )  # type: GraphQLResult
+    return result
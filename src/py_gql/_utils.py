@@ -6,6 +6,7 @@ Some generic laguage level utilities for internal use.
 import collections
 import functools
 import sys
+import threading
 import warnings
 from typing import (
     AbstractSet,
@@ -56,6 +57,67 @@ def lazy(maybe_callable: Union[T, Callable[[], T]]) -> T:
     return maybe_callable
 
 
+class _LazyAttribute:
+    __slots__ = ("name", "source", "default_factory")
+
+    def __init__(
+        self,
+        name: str,
+        source: str,
+        default_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.name = name
+        self.source = source
+        self.default_factory = default_factory
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+
+        # Inlined `lazy()`: the source is usually already a concrete value.
+        value = getattr(instance, self.source)
+        if callable(value):
+            value = value()
+        if not value and self.default_factory is not None:
+            value = self.default_factory()
+        # Shadow the descriptor: further reads are plain attribute lookups.
+        instance.__dict__[self.name] = value
+        return value
+
+
+def lazy_attribute(
+    name: str, source: str, default_factory: Optional[Callable[[], Any]] = None,
+) -> Any:
+    """
+    Define an attribute resolving a :data:`Lazy` value on first access.
+
+    The value is read from the ``source`` attribute, resolved with
+    :func:`lazy` and stored on the instance under ``name``. As this is a
+    non-data descriptor, the stored value then takes precedence and later
+    reads are plain attribute lookups; assigning to ``name`` (e.g. to set a
+    non lazy value upfront) bypasses the descriptor entirely. Falsy values are
+    replaced with the result of ``default_factory`` when provided.
+
+    >>> class Foo:
+    ...     bar = lazy_attribute("bar", "_bar", list)
+    ...     def __init__(self, bar):
+    ...         self._bar = bar
+
+    >>> foo = Foo(lambda: [42])
+    >>> foo.bar
+    [42]
+    >>> foo.__dict__["bar"]
+    [42]
+
+    >>> Foo(lambda: None).bar
+    []
+
+    """
+    # Typed as Any so that class attributes can be annotated with the type of
+    # the resolved value.
+    return _LazyAttribute(name, source, default_factory)
+
+
 def map_and_filter(
     func: Callable[[T], Optional[T]], iterable: Iterable[T]
 ) -> List[T]:
@@ -215,7 +277,7 @@ def is_iterable(value: Any, strings: bool = True) -> bool:
         return strings or not isinstance(value, (str, bytes))
 
 
-if sys.version < "3.6":  # noqa: C901
+if sys.version_info < (3, 6):  # noqa: C901
     OrderedDict = collections.OrderedDict
 
     K = TypeVar("K")
@@ -284,8 +346,8 @@ if sys.version < "3.6":  # noqa: C901
 
 
 else:
-    OrderedDict = dict  # type: ignore
-    DefaultOrderedDict = collections.defaultdict  # type: ignore
+    OrderedDict = dict
+    DefaultOrderedDict = collections.defaultdict
 
 
 def classdispatch(
@@ -377,3 +439,70 @@ def deprecated(reason: str) -> Callable[[Fn], Fn]:
         return cast(Fn, deprecated_fn)
 
     return decorator
+
+
+class LRUCache:
+    """
+    Minimal thread safe mapping evicting least recently used entries.
+
+    Note:
+        This is not generic as subclassing ``Generic[...]`` breaks when
+        cythonized (see ``schema/_types.py``).
+
+    Args:
+        maxsize: Maximum number of entries to keep.
+
+    >>> cache = LRUCache(2)
+    >>> cache["a"] = 1
+    >>> cache["b"] = 2
+    >>> cache.get("a")
+    1
+    >>> cache["c"] = 3
+    >>> cache.get("b") is None
+    True
+    >>> sorted(cache.keys())
+    ['a', 'c']
+    >>> "b" in cache, len(cache)
+    (False, 2)
+    """
+
+    __slots__ = ("maxsize", "_data", "_lock")
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data = (
+            collections.OrderedDict()
+        )  # type: collections.OrderedDict[Hashable, Any]
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._data.keys())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -239,6 +239,19 @@ class InvalidOperationError(ExecutionError):
     pass
 
 
+class PersistedQueryNotFound(ExecutionError):
+    """
+    The provided persisted query hash is unknown.
+
+    Following the `Automatic Persisted Queries
+    <https://github.com/apollographql/apollo-link-persisted-queries>`_
+    protocol, clients are expected to retry with the full document.
+    """
+
+    def __init__(self, message: str = "PersistedQueryNotFound"):
+        super().__init__(message)
+
+
 class VariableCoercionError(GraphQLLocatedError):
     pass
 
@@ -3,9 +3,9 @@
 from typing import Any, Callable, Dict, List
 
 from .._utils import OrderedDict
-from ..exc import CoercionError, ResolverError
+from ..exc import CoercionError, ResolverError, ScalarSerializationError
 from ..lang import ast as _ast
-from ..schema import Field, GraphQLType, ObjectType
+from ..schema import Field, GraphQLType, NonNullType, ObjectType, ScalarType
 from .executor import Executor
 from .wrappers import GroupedFields, ResolveInfo, ResponsePath
 
@@ -87,6 +87,35 @@ class BlockingExecutor(Executor):
         info: ResolveInfo,
         resolved_value: Any,
     ) -> List[Any]:
+        if type(inner_type) is NonNullType:
+            item_type, nullable = inner_type.type, False
+        else:
+            item_type, nullable = inner_type, True
+
+        if isinstance(item_type, ScalarType):
+            # Lists of scalars can be large: serialize the entries directly
+            # rather than going through `complete_value` for each of them.
+            # Any failure falls back to the generic path below so errors are
+            # reported with the correct path.
+            if not isinstance(resolved_value, (list, tuple)):
+                resolved_value = list(resolved_value)
+
+            if nullable or all(entry is not None for entry in resolved_value):
+                serialize = item_type.serialize
+                try:
+                    serialized = [
+                        None if entry is None else serialize(entry)
+                        for entry in resolved_value
+                    ]
+                except ScalarSerializationError:
+                    pass
+                else:
+                    # Custom scalars may serialize non null values to None.
+                    if nullable or all(
+                        entry is not None for entry in serialized
+                    ):
+                        return serialized
+
         return [
             self.complete_value(inner_type, nodes, path + [index], info, entry)
             for index, entry in enumerate(resolved_value)
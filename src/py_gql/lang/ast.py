@@ -51,12 +51,12 @@ class Node:
         )
 
     def __copy__(self):
-        return self.__class__(  # type: ignore
+        return self.__class__(
             **{k: getattr(self, k) for k in self.__slots__}  # type: ignore
         )
 
     def __deepcopy__(self, memo):
-        return self.__class__(  # type: ignore
+        return self.__class__(
             **{  # type: ignore
                 k: copy.deepcopy(getattr(self, k), memo) for k in self.__slots__
             }
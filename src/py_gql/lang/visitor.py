@@ -4,9 +4,9 @@ Visitors provide abstractions for traversing and transforming a GraphQL AST.
 """
 
 import functools
-from typing import Optional, TypeVar, Union
+from typing import Dict, Optional, Tuple, TypeVar, Union
 
-from .._utils import classdispatch, map_and_filter
+from .._utils import map_and_filter
 from ..exc import GraphQLError
 from . import ast as _ast
 
@@ -49,6 +49,80 @@ def _visit_method(method):
     return wrapper
 
 
+# Name of the :class:`ASTVisitor` method traversing each node class.
+_VISIT_METHODS = {
+    _ast.Document: "_visit_document",
+    _ast.OperationDefinition: "_visit_operation_definition",
+    _ast.VariableDefinition: "_visit_variable_definition",
+    _ast.Variable: "_visit_variable",
+    _ast.SelectionSet: "_visit_selection_set",
+    _ast.Field: "_visit_field",
+    _ast.Argument: "_visit_argument",
+    _ast.FragmentSpread: "_visit_fragment_spread",
+    _ast.InlineFragment: "_visit_inline_fragment",
+    _ast.FragmentDefinition: "_visit_fragment_definition",
+    _ast.IntValue: "_visit_value",
+    _ast.FloatValue: "_visit_value",
+    _ast.BooleanValue: "_visit_value",
+    _ast.NullValue: "_visit_value",
+    _ast.EnumValue: "_visit_value",
+    _ast.StringValue: "_visit_value",
+    _ast.ListValue: "_visit_value",
+    _ast.ObjectValue: "_visit_value",
+    _ast.ObjectField: "_visit_object_field",
+    _ast.Directive: "_visit_directive",
+    _ast.NonNullType: "_visit_type",
+    _ast.ListType: "_visit_type",
+    _ast.NamedType: "_visit_type",
+    _ast.SchemaDefinition: "_visit_schema_definition",
+    _ast.OperationTypeDefinition: "_visit_operation_type_definition",
+    _ast.ScalarTypeDefinition: "_visit_scalar_type_definition",
+    _ast.ObjectTypeDefinition: "_visit_object_type_definition",
+    _ast.FieldDefinition: "_visit_field_definition",
+    _ast.InputValueDefinition: "_visit_input_value_definition",
+    _ast.InterfaceTypeDefinition: "_visit_interface_type_definition",
+    _ast.UnionTypeDefinition: "_visit_union_type_definition",
+    _ast.EnumTypeDefinition: "_visit_enum_type_definition",
+    _ast.EnumValueDefinition: "_visit_enum_value_definition",
+    _ast.InputObjectTypeDefinition: "_visit_input_object_type_definition",
+    _ast.SchemaExtension: "_visit_schema_definition",
+    _ast.ScalarTypeExtension: "_visit_scalar_type_definition",
+    _ast.ObjectTypeExtension: "_visit_object_type_definition",
+    _ast.InterfaceTypeExtension: "_visit_interface_type_definition",
+    _ast.UnionTypeExtension: "_visit_union_type_definition",
+    _ast.EnumTypeExtension: "_visit_enum_type_definition",
+    _ast.InputObjectTypeExtension: "_visit_input_object_type_definition",
+    _ast.DirectiveDefinition: "_visit_directive_definition",
+}  # type: Dict[type, str]
+
+
+_DEFINITION_CLASSES = frozenset(
+    (
+        _ast.OperationDefinition,
+        _ast.FragmentDefinition,
+        _ast.SchemaDefinition,
+        _ast.ScalarTypeDefinition,
+        _ast.ObjectTypeDefinition,
+        _ast.InterfaceTypeDefinition,
+        _ast.UnionTypeDefinition,
+        _ast.EnumTypeDefinition,
+        _ast.InputObjectTypeDefinition,
+        _ast.SchemaExtension,
+        _ast.ScalarTypeExtension,
+        _ast.ObjectTypeExtension,
+        _ast.InterfaceTypeExtension,
+        _ast.UnionTypeExtension,
+        _ast.EnumTypeExtension,
+        _ast.InputObjectTypeExtension,
+        _ast.DirectiveDefinition,
+    )
+)
+
+_SELECTION_CLASSES = frozenset(
+    (_ast.Field, _ast.FragmentSpread, _ast.InlineFragment)
+)
+
+
 class ASTVisitor:
     """
     Base visitor class encoding AST traversal and transforms behaviors.
@@ -97,55 +171,11 @@ class ASTVisitor:
             and :meth:`leave` is encoded.
 
         """
-        return classdispatch(
-            node,
-            {
-                _ast.Document: self._visit_document,
-                _ast.OperationDefinition: self._visit_operation_definition,
-                _ast.VariableDefinition: self._visit_variable_definition,
-                _ast.Variable: self._visit_variable,
-                _ast.SelectionSet: self._visit_selection_set,
-                _ast.Field: self._visit_field,
-                _ast.Argument: self._visit_argument,
-                _ast.FragmentSpread: self._visit_fragment_spread,
-                _ast.InlineFragment: self._visit_inline_fragment,
-                _ast.FragmentDefinition: self._visit_fragment_definition,
-                _ast.IntValue: self._visit_value,
-                _ast.FloatValue: self._visit_value,
-                _ast.BooleanValue: self._visit_value,
-                _ast.NullValue: self._visit_value,
-                _ast.EnumValue: self._visit_value,
-                _ast.StringValue: self._visit_value,
-                _ast.ListValue: self._visit_value,
-                _ast.ObjectValue: self._visit_value,
-                _ast.ObjectField: self._visit_object_field,
-                _ast.Directive: self._visit_directive,
-                _ast.NonNullType: self._visit_type,
-                _ast.ListType: self._visit_type,
-                _ast.NamedType: self._visit_type,
-                _ast.SchemaDefinition: self._visit_schema_definition,
-                _ast.OperationTypeDefinition: self._visit_operation_type_definition,
-                _ast.ScalarTypeDefinition: self._visit_scalar_type_definition,
-                _ast.ObjectTypeDefinition: self._visit_object_type_definition,
-                _ast.FieldDefinition: self._visit_field_definition,
-                _ast.InputValueDefinition: self._visit_input_value_definition,
-                _ast.InterfaceTypeDefinition: self._visit_interface_type_definition,
-                _ast.UnionTypeDefinition: self._visit_union_type_definition,
-                _ast.EnumTypeDefinition: self._visit_enum_type_definition,
-                _ast.EnumValueDefinition: self._visit_enum_value_definition,
-                _ast.InputObjectTypeDefinition: (
-                    self._visit_input_object_type_definition
-                ),
-                _ast.SchemaExtension: self._visit_schema_definition,
-                _ast.ScalarTypeExtension: self._visit_scalar_type_definition,
-                _ast.ObjectTypeExtension: self._visit_object_type_definition,
-                _ast.InterfaceTypeExtension: self._visit_interface_type_definition,
-                _ast.UnionTypeExtension: self._visit_union_type_definition,
-                _ast.EnumTypeExtension: self._visit_enum_type_definition,
-                _ast.InputObjectTypeExtension: self._visit_input_object_type_definition,
-                _ast.DirectiveDefinition: self._visit_directive_definition,
-            },
-        )
+        try:
+            name = _VISIT_METHODS[node.__class__]
+        except KeyError:
+            raise TypeError(node.__class__)
+        return getattr(self, name)(node)  # type: ignore
 
     @_visit_method
     def _visit_document(self, document: _ast.Document) -> _ast.Document:
@@ -155,30 +185,9 @@ class ASTVisitor:
         return document
 
     def _visit_definition(self, node: _ast.Definition) -> _ast.Definition:
-        return classdispatch(
-            node,
-            {
-                _ast.OperationDefinition: self._visit_operation_definition,
-                _ast.FragmentDefinition: self._visit_fragment_definition,
-                _ast.SchemaDefinition: self._visit_schema_definition,
-                _ast.ScalarTypeDefinition: self._visit_scalar_type_definition,
-                _ast.ObjectTypeDefinition: self._visit_object_type_definition,
-                _ast.InterfaceTypeDefinition: self._visit_interface_type_definition,
-                _ast.UnionTypeDefinition: self._visit_union_type_definition,
-                _ast.EnumTypeDefinition: self._visit_enum_type_definition,
-                _ast.InputObjectTypeDefinition: (
-                    self._visit_input_object_type_definition
-                ),
-                _ast.SchemaExtension: self._visit_schema_definition,
-                _ast.ScalarTypeExtension: self._visit_scalar_type_definition,
-                _ast.ObjectTypeExtension: self._visit_object_type_definition,
-                _ast.InterfaceTypeExtension: self._visit_interface_type_definition,
-                _ast.UnionTypeExtension: self._visit_union_type_definition,
-                _ast.EnumTypeExtension: self._visit_enum_type_definition,
-                _ast.InputObjectTypeExtension: self._visit_input_object_type_definition,
-                _ast.DirectiveDefinition: self._visit_directive_definition,
-            },
-        )
+        if node.__class__ not in _DEFINITION_CLASSES:
+            raise TypeError(node.__class__)
+        return getattr(self, _VISIT_METHODS[node.__class__])(node)  # type: ignore
 
     @_visit_method
     def _visit_operation_definition(
@@ -244,14 +253,11 @@ class ASTVisitor:
         return selection_set
 
     def _visit_selection(self, selection: S) -> S:
-        return classdispatch(
-            selection,
-            {
-                _ast.Field: self._visit_field,
-                _ast.FragmentSpread: self._visit_fragment_spread,
-                _ast.InlineFragment: self._visit_inline_fragment,
-            },
-        )
+        if selection.__class__ not in _SELECTION_CLASSES:
+            raise TypeError(selection.__class__)
+        return getattr(  # type: ignore
+            self, _VISIT_METHODS[selection.__class__]
+        )(selection)
 
     @_visit_method
     def _visit_field(self, field: _ast.Field) -> _ast.Field:
@@ -452,6 +458,114 @@ class ASTVisitor:
         return definition
 
 
+# Name of the ``enter_*`` and ``leave_*`` handlers of :class:`DispatchingVisitor`
+# for each node class.
+_HANDLER_NAMES = {
+    _ast.Document: ("enter_document", "leave_document"),
+    _ast.OperationDefinition: (
+        "enter_operation_definition",
+        "leave_operation_definition",
+    ),
+    _ast.FragmentDefinition: (
+        "enter_fragment_definition",
+        "leave_fragment_definition",
+    ),
+    _ast.VariableDefinition: (
+        "enter_variable_definition",
+        "leave_variable_definition",
+    ),
+    _ast.Directive: ("enter_directive", "leave_directive"),
+    _ast.Argument: ("enter_argument", "leave_argument"),
+    _ast.SelectionSet: ("enter_selection_set", "leave_selection_set"),
+    _ast.Field: ("enter_field", "leave_field"),
+    _ast.FragmentSpread: ("enter_fragment_spread", "leave_fragment_spread"),
+    _ast.InlineFragment: ("enter_inline_fragment", "leave_inline_fragment"),
+    _ast.NullValue: ("enter_null_value", "leave_null_value"),
+    _ast.IntValue: ("enter_int_value", "leave_int_value"),
+    _ast.FloatValue: ("enter_float_value", "leave_float_value"),
+    _ast.StringValue: ("enter_string_value", "leave_string_value"),
+    _ast.BooleanValue: ("enter_boolean_value", "leave_boolean_value"),
+    _ast.EnumValue: ("enter_enum_value", "leave_enum_value"),
+    _ast.Variable: ("enter_variable", "leave_variable"),
+    _ast.ListValue: ("enter_list_value", "leave_list_value"),
+    _ast.ObjectValue: ("enter_object_value", "leave_object_value"),
+    _ast.ObjectField: ("enter_object_field", "leave_object_field"),
+    _ast.NamedType: ("enter_named_type", "leave_named_type"),
+    _ast.ListType: ("enter_list_type", "leave_list_type"),
+    _ast.NonNullType: ("enter_non_null_type", "leave_non_null_type"),
+    _ast.SchemaDefinition: (
+        "enter_schema_definition",
+        "leave_schema_definition",
+    ),
+    _ast.OperationTypeDefinition: (
+        "enter_operation_type_definition",
+        "leave_operation_type_definition",
+    ),
+    _ast.ScalarTypeDefinition: (
+        "enter_scalar_type_definition",
+        "leave_scalar_type_definition",
+    ),
+    _ast.ObjectTypeDefinition: (
+        "enter_object_type_definition",
+        "leave_object_type_definition",
+    ),
+    _ast.FieldDefinition: ("enter_field_definition", "leave_field_definition"),
+    _ast.InputValueDefinition: (
+        "enter_input_value_definition",
+        "leave_input_value_definition",
+    ),
+    _ast.InterfaceTypeDefinition: (
+        "enter_interface_type_definition",
+        "leave_interface_type_definition",
+    ),
+    _ast.UnionTypeDefinition: (
+        "enter_union_type_definition",
+        "leave_union_type_definition",
+    ),
+    _ast.EnumTypeDefinition: (
+        "enter_enum_type_definition",
+        "leave_enum_type_definition",
+    ),
+    _ast.EnumValueDefinition: (
+        "enter_enum_value_definition",
+        "leave_enum_value_definition",
+    ),
+    _ast.InputObjectTypeDefinition: (
+        "enter_input_object_type_definition",
+        "leave_input_object_type_definition",
+    ),
+    _ast.SchemaExtension: ("enter_schema_extension", "leave_schema_extension"),
+    _ast.ScalarTypeExtension: (
+        "enter_scalar_type_extension",
+        "leave_scalar_type_extension",
+    ),
+    _ast.ObjectTypeExtension: (
+        "enter_object_type_extension",
+        "leave_object_type_extension",
+    ),
+    _ast.InterfaceTypeExtension: (
+        "enter_interface_type_extension",
+        "leave_interface_type_extension",
+    ),
+    _ast.UnionTypeExtension: (
+        "enter_union_type_extension",
+        "leave_union_type_extension",
+    ),
+    _ast.EnumTypeExtension: (
+        "enter_enum_type_extension",
+        "leave_enum_type_extension",
+    ),
+    _ast.InputObjectTypeExtension: (
+        "enter_input_object_type_extension",
+        "leave_input_object_type_extension",
+    ),
+    _ast.DirectiveDefinition: (
+        "enter_directive_definition",
+        "leave_directive_definition",
+    ),
+}  # type: Dict[type, Tuple[str, str]]
+
+
 class DispatchingVisitor(ASTVisitor):
     """
     Base class for specialized visitors.
@@ -465,106 +579,18 @@ class DispatchingVisitor(ASTVisitor):
     """
 
     def enter(self, node: N) -> Optional[N]:
-        # Not sure why typechecking doesn't work here, maybe something to do
-        # with the decorator?
-        return classdispatch(  # type: ignore
-            node,
-            {
-                _ast.Document: self.enter_document,
-                _ast.OperationDefinition: self.enter_operation_definition,
-                _ast.FragmentDefinition: self.enter_fragment_definition,
-                _ast.VariableDefinition: self.enter_variable_definition,
-                _ast.Directive: self.enter_directive,
-                _ast.Argument: self.enter_argument,
-                _ast.SelectionSet: self.enter_selection_set,
-                _ast.Field: self.enter_field,
-                _ast.FragmentSpread: self.enter_fragment_spread,
-                _ast.InlineFragment: self.enter_inline_fragment,
-                _ast.NullValue: self.enter_null_value,
-                _ast.IntValue: self.enter_int_value,
-                _ast.FloatValue: self.enter_float_value,
-                _ast.StringValue: self.enter_string_value,
-                _ast.BooleanValue: self.enter_boolean_value,
-                _ast.EnumValue: self.enter_enum_value,
-                _ast.Variable: self.enter_variable,
-                _ast.ListValue: self.enter_list_value,
-                _ast.ObjectValue: self.enter_object_value,
-                _ast.ObjectField: self.enter_object_field,
-                _ast.NamedType: self.enter_named_type,
-                _ast.ListType: self.enter_list_type,
-                _ast.NonNullType: self.enter_non_null_type,
-                _ast.SchemaDefinition: self.enter_schema_definition,
-                _ast.OperationTypeDefinition: self.enter_operation_type_definition,
-                _ast.ScalarTypeDefinition: self.enter_scalar_type_definition,
-                _ast.ObjectTypeDefinition: self.enter_object_type_definition,
-                _ast.FieldDefinition: self.enter_field_definition,
-                _ast.InputValueDefinition: self.enter_input_value_definition,
-                _ast.InterfaceTypeDefinition: self.enter_interface_type_definition,
-                _ast.UnionTypeDefinition: self.enter_union_type_definition,
-                _ast.EnumTypeDefinition: self.enter_enum_type_definition,
-                _ast.EnumValueDefinition: self.enter_enum_value_definition,
-                _ast.InputObjectTypeDefinition: self.enter_input_object_type_definition,
-                _ast.SchemaExtension: self.enter_schema_extension,
-                _ast.ScalarTypeExtension: self.enter_scalar_type_extension,
-                _ast.ObjectTypeExtension: self.enter_object_type_extension,
-                _ast.InterfaceTypeExtension: self.enter_interface_type_extension,
-                _ast.UnionTypeExtension: self.enter_union_type_extension,
-                _ast.EnumTypeExtension: self.enter_enum_type_extension,
-                _ast.InputObjectTypeExtension: self.enter_input_object_type_extension,
-                _ast.DirectiveDefinition: self.enter_directive_definition,
-            },
-        )
+        try:
+            name = _HANDLER_NAMES[node.__class__][0]
+        except KeyError:
+            raise TypeError(node.__class__)
+        return getattr(self, name)(node)  # type: ignore
 
-    # Not sure why typechecking doesn't work here, maybe something to do
-    # with the decorator?
     def leave(self, node: _ast.Node) -> None:
-        return classdispatch(  # type: ignore
-            node,
-            {
-                _ast.Document: self.leave_document,
-                _ast.OperationDefinition: self.leave_operation_definition,
-                _ast.FragmentDefinition: self.leave_fragment_definition,
-                _ast.VariableDefinition: self.leave_variable_definition,
-                _ast.Directive: self.leave_directive,
-                _ast.Argument: self.leave_argument,
-                _ast.SelectionSet: self.leave_selection_set,
-                _ast.Field: self.leave_field,
-                _ast.FragmentSpread: self.leave_fragment_spread,
-                _ast.InlineFragment: self.leave_inline_fragment,
-                _ast.NullValue: self.leave_null_value,
-                _ast.IntValue: self.leave_int_value,
-                _ast.FloatValue: self.leave_float_value,
-                _ast.StringValue: self.leave_string_value,
-                _ast.BooleanValue: self.leave_boolean_value,
-                _ast.EnumValue: self.leave_enum_value,
-                _ast.Variable: self.leave_variable,
-                _ast.ListValue: self.leave_list_value,
-                _ast.ObjectValue: self.leave_object_value,
-                _ast.ObjectField: self.leave_object_field,
-                _ast.NamedType: self.leave_named_type,
-                _ast.ListType: self.leave_list_type,
-                _ast.NonNullType: self.leave_non_null_type,
-                _ast.SchemaDefinition: self.leave_schema_definition,
-                _ast.OperationTypeDefinition: self.leave_operation_type_definition,
-                _ast.ScalarTypeDefinition: self.leave_scalar_type_definition,
-                _ast.ObjectTypeDefinition: self.leave_object_type_definition,
-                _ast.FieldDefinition: self.leave_field_definition,
-                _ast.InputValueDefinition: self.leave_input_value_definition,
-                _ast.InterfaceTypeDefinition: self.leave_interface_type_definition,
-                _ast.UnionTypeDefinition: self.leave_union_type_definition,
-                _ast.EnumTypeDefinition: self.leave_enum_type_definition,
-                _ast.EnumValueDefinition: self.leave_enum_value_definition,
-                _ast.InputObjectTypeDefinition: self.leave_input_object_type_definition,
-                _ast.SchemaExtension: self.leave_schema_extension,
-                _ast.ScalarTypeExtension: self.leave_scalar_type_extension,
-                _ast.ObjectTypeExtension: self.leave_object_type_extension,
-                _ast.InterfaceTypeExtension: self.leave_interface_type_extension,
-                _ast.UnionTypeExtension: self.leave_union_type_extension,
-                _ast.EnumTypeExtension: self.leave_enum_type_extension,
-                _ast.InputObjectTypeExtension: self.leave_input_object_type_extension,
-                _ast.DirectiveDefinition: self.leave_directive_definition,
-            },
-        )
+        try:
+            name = _HANDLER_NAMES[node.__class__][1]
+        except KeyError:
+            raise TypeError(node.__class__)
+        getattr(self, name)(node)
 
     def enter_document(self, node: _ast.Document) -> Optional[_ast.Document]:
         return node
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-# flake8: noqa
 """
 The :mod:`py_gql.schema` module exposes all the necessary classes and
 functions for programmatically creating, validating and inspecting GraphQL
@@ -51,3 +50,46 @@ from .types import (
     is_output_type,
     unwrap_type,
 )
+
+
+__all__ = (
+    "Schema",
+    "SchemaVisitor",
+    "ResolverMap",
+    "is_introspection_type",
+    "SPECIFIED_DIRECTIVES",
+    "DeprecatedDirective",
+    "IncludeDirective",
+    "SkipDirective",
+    "SPECIFIED_SCALAR_TYPES",
+    "ID",
+    "UUID",
+    "Boolean",
+    "Float",
+    "Int",
+    "RegexType",
+    "String",
+    "Argument",
+    "Directive",
+    "EnumType",
+    "EnumValue",
+    "Field",
+    "GraphQLAbstractType",
+    "GraphQLCompositeType",
+    "GraphQLLeafType",
+    "GraphQLType",
+    "InputField",
+    "InputObjectType",
+    "InputValue",
+    "InterfaceType",
+    "ListType",
+    "NamedType",
+    "NonNullType",
+    "ObjectType",
+    "ScalarType",
+    "Type",
+    "UnionType",
+    "is_input_type",
+    "is_output_type",
+    "unwrap_type",
+)
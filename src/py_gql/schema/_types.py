@@ -8,9 +8,10 @@
 # These types should usually not be imported from here but from the types.py
 # file located in the same folder.
 
-from typing import Any, Generic, Optional, TypeVar
+import weakref
+from typing import Any, Generic, MutableMapping, Optional, Tuple, Type, TypeVar
 
-from .._utils import Lazy, lazy
+from .._utils import Lazy
 from ..lang import ast
 
 
@@ -25,15 +26,16 @@ class GraphQLType:
     this class.
     """
 
+    __slots__ = ()
+
     def __eq__(self, lhs: Any) -> bool:
-        return self is lhs or (
-            isinstance(self, (WrappingType))
-            and self.__class__ == lhs.__class__
-            and self.type == lhs.type
-        )
+        # Named types are unique within a schema, see `WrappingType.__eq__`
+        # for structural equality of wrapping types.
+        return self is lhs
 
-    def __hash__(self) -> int:
-        return id(self)
+    # Defining __eq__ would otherwise reset __hash__ to None, reusing the
+    # default identity hash keeps the C level slot.
+    __hash__ = object.__hash__
 
     def as_list(self: TGraphQLType) -> "ListType[TGraphQLType]":
         """
@@ -60,6 +62,8 @@ class NamedType(GraphQLType):
         name (str): Type name.
     """
 
+    __slots__ = ()
+
     name = NotImplemented  # type: str
 
     def __str__(self) -> str:
@@ -69,20 +73,43 @@ class NamedType(GraphQLType):
         return "%s(%s at %d)" % (self.__class__.__name__, self.name, id(self))
 
 
+# Wrappers of concrete types which are not tied to a source node are
+# interchangeable so they are interned: repeated `NonNullType(String)` calls
+# return the same object as long as it is alive. The key uses `id()` which is
+# safe as the wrapper holds a reference to the wrapped type.
+_INTERNED = (
+    weakref.WeakValueDictionary()
+)  # type: MutableMapping[Tuple[Type[Any], int], WrappingType[Any]]
+
+
 class WrappingType(GraphQLType, Generic[TGraphQLType]):
+    def __new__(cls, type_: Any = None, node: Any = None) -> Any:
+        if node is None and type_ is not None and not callable(type_):
+            key = (cls, id(type_))
+            interned = _INTERNED.get(key)
+            if interned is None:
+                interned = _INTERNED[key] = super().__new__(cls)
+            return interned
+        return super().__new__(cls)
+
     def __init__(self, type_: Lazy[TGraphQLType]):
         self._ltype = type_
-        self._type = None  # type: Optional[TGraphQLType]
 
+    # Read only as interned wrappers are shared across the whole process.
     @property
     def type(self) -> TGraphQLType:
-        if self._type is None:
-            self._type = lazy(self._ltype)
-        return self._type
+        type_ = self._ltype
+        if callable(type_):
+            type_ = self._ltype = type_()
+        return type_
+
+    def __eq__(self, lhs: Any) -> bool:
+        return self is lhs or (
+            self.__class__ is lhs.__class__ and self.type == lhs.type
+        )
 
-    @type.setter
-    def type(self, type_: TGraphQLType) -> None:
-        self._type = self._ltype = type_
+    # Defining __eq__ would otherwise reset __hash__ to None.
+    __hash__ = GraphQLType.__hash__
 
 
 class NonNullType(WrappingType[TGraphQLType]):
@@ -107,7 +134,7 @@ class NonNullType(WrappingType[TGraphQLType]):
 
     """
 
-    __slots__ = ("node", "_ltype", "_type")
+    __slots__ = ("node", "_ltype")
 
     def __init__(
         self, type_: Lazy[TGraphQLType], node: Optional[ast.NonNullType] = None
@@ -141,7 +168,7 @@ class ListType(WrappingType[TGraphQLType]):
             Source node used when building type from the SDL
     """
 
-    __slots__ = ("node", "_ltype", "_type")
+    __slots__ = ("node", "_ltype")
 
     def __init__(
         self, type_: Lazy[TGraphQLType], node: Optional[ast.ListType] = None
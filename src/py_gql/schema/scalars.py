@@ -234,6 +234,8 @@ class RegexType(ScalarType):
         description (str): Type description
     """
 
+    __slots__ = ("_regex",)
+
     def __init__(self, name, regex, description=None):
 
         if isinstance(regex, str):
@@ -6,6 +6,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
@@ -97,7 +98,9 @@ class Schema(ResolverMap):
         "subscription_type",
         "nodes",
         "_possible_types",
+        "_possible_type_sets",
         "_is_valid",
+        "_version",
         "_literal_types_cache",
         "types",
         "directives",
@@ -136,12 +139,19 @@ class Schema(ResolverMap):
             _type_map=_default_type_map(),
         )  # type: Dict[str, NamedType]
 
+        self._version = 0
         self._invalidate_and_rebuild_caches()
 
     def _invalidate_and_rebuild_caches(self):
+        # Bumped on every modification of the type map so that external caches
+        # derived from the schema (e.g. validation results) can be keyed on it.
+        self._version += 1
         self._possible_types = (
             {}
         )  # type: Dict[GraphQLAbstractType, Sequence[ObjectType]]
+        self._possible_type_sets = (
+            {}
+        )  # type: Dict[GraphQLAbstractType, FrozenSet[ObjectType]]
         self._is_valid = None  # type: Optional[bool]
         self._literal_types_cache = {}  # type: Dict[_ast.Type, GraphQLType]
 
@@ -172,7 +182,7 @@ class Schema(ResolverMap):
                         "Cannot replace specified type %s" % original_type
                     )
 
-                busted_cache = new_type != original_type
+                busted_cache = busted_cache or new_type != original_type
 
                 if new_type is None:
                     del self.types[type_name]
@@ -227,11 +237,19 @@ class Schema(ResolverMap):
 
             fix_type_references(self)
             self._invalidate_and_rebuild_caches()
+        elif types or directives:
+            # Nothing to rebuild, but the schema may still have become invalid
+            # (e.g. a replaced directive).
+            self._is_valid = None
+            self._version += 1
 
     def validate(self):
         """
         Check that the schema is valid.
 
+        The result is cached and subsequent calls are no-ops until the schema
+        is modified through one of its methods.
+
         Raises:
             :class:`~py_gql.exc.SchemaError` if the schema is invalid.
         """
@@ -335,7 +353,17 @@ class Schema(ResolverMap):
         if not isinstance(type_, ObjectType):
             return False
 
-        return type_ in self.get_possible_types(abstract_type)
+        # This runs for every value resolved through an abstract type during
+        # execution, so membership is checked against a set rather than
+        # scanning the list of possible types.
+        try:
+            possible_types = self._possible_type_sets[abstract_type]
+        except KeyError:
+            possible_types = self._possible_type_sets[
+                abstract_type
+            ] = frozenset(self.get_possible_types(abstract_type))
+
+        return type_ in possible_types
 
     def is_subtype(self, type_, super_type):
         """
@@ -617,13 +645,18 @@ def _build_type_map(
         _type_map if _type_map is not None else {}
     )  # type: Dict[str, NamedType]
 
-    for type_ in types:
+    # Depth first walk using an explicit stack rather than recursion. This
+    # visits types in the same order and resolves every lazy type, field and
+    # argument once while building the schema.
+    stack = list(types)
+    stack.reverse()
+
+    while stack:
+        type_ = stack.pop()
 
         if type_ is None:
             continue
 
-        child_types = []  # type: List[GraphQLType]
-
         inner_type = unwrap_type(type_)
 
         if not isinstance(inner_type, NamedType):
@@ -641,6 +674,8 @@ def _build_type_map(
 
         type_map[name] = inner_type
 
+        child_types = []  # type: List[GraphQLType]
+
         if isinstance(inner_type, UnionType):
             child_types.extend(inner_type.types)
 
@@ -656,7 +691,7 @@ def _build_type_map(
             for input_field in inner_type.fields:
                 child_types.append(input_field.type)
 
-        type_map.update(_build_type_map(child_types, _type_map=type_map))
+        stack.extend(reversed(child_types))
 
     if directives:
         directive_types = []  # type: List[GraphQLType]
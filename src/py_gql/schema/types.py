@@ -17,7 +17,7 @@ from typing import (
     cast,
 )
 
-from .._utils import Lazy, lazy
+from .._utils import Lazy, lazy_attribute
 from ..exc import ScalarParsingError, ScalarSerializationError, UnknownEnumValue
 from ..lang import ast as _ast
 from ..lang.parser import (
@@ -60,6 +60,8 @@ class GraphQLAbstractType(NamedType):
     that the value will be of a concrete ObjectType.
     """
 
+    __slots__ = ()
+
     resolve_type = NotImplemented  # type: Optional[TypeResolver]
 
 
@@ -70,7 +72,7 @@ class GraphQLLeafType(NamedType):
     These types may describe types which may be leaf values.
     """
 
-    pass
+    __slots__ = ()
 
 
 class GraphQLCompositeType(NamedType):
@@ -81,24 +83,40 @@ class GraphQLCompositeType(NamedType):
     """
 
     _source_fields = NotImplemented  # type: LazySeq[Field]
-    _fields = NotImplemented  # type: Optional[Sequence[Field]]
 
-    @property
-    def fields(self) -> Sequence["Field"]:
-        if self._fields is None:
-            self._fields = lazy(self._source_fields) or []
-        return self._fields
+    fields = lazy_attribute(
+        "fields", "_source_fields", list
+    )  # type: Sequence[Field]
 
-    @fields.setter
-    def fields(self, fields: List["Field"]) -> None:
-        self._fields = self._source_fields = fields
+    _field_map = None  # type: Optional[Dict[str, Field]]
+    _field_map_source = None  # type: Optional[Sequence[Field]]
 
     @property
     def field_map(self) -> Dict[str, "Field"]:
-        return {f.name: f for f in self.fields}
+        # Memoized against the identity of `fields` so that assigning new
+        # fields invalidates it.
+        fields = self.fields
+        if self._field_map is None or self._field_map_source is not fields:
+            self._field_map = {f.name: f for f in fields}
+            self._field_map_source = fields
+        return self._field_map
 
 
 class InputValue:
+    # `__dict__` only holds lazily resolved attributes, see `lazy_attribute`.
+    __slots__ = (
+        "name",
+        "description",
+        "has_default_value",
+        "node",
+        "_default_value",
+        "_ltype",
+        "python_name",
+        "__dict__",
+    )
+
+    type = lazy_attribute("type", "_ltype")  # type: GraphQLType
+
     def __init__(
         self,
         name: str,
@@ -114,12 +132,11 @@ class InputValue:
         self.node = node
         self._default_value = default_value
         self._ltype = type_
-        self._type = None  # type: Optional[GraphQLType]
         self.python_name = python_name or name
 
     @property
     def default_value(self) -> Any:
-        if self._default_value is _UNSET:
+        if not self.has_default_value:
             raise AttributeError("No default value")
         return self._default_value
 
@@ -133,21 +150,10 @@ class InputValue:
         self._default_value = _UNSET
         self.has_default_value = False
 
-    @property
-    def type(self) -> GraphQLType:
-        if self._type is None:
-            self._type = lazy(self._ltype)
-        return self._type
-
-    @type.setter
-    def type(self, type_: GraphQLType) -> None:
-        self._type = self._ltype = type_
-
     @property
     def required(self) -> bool:
-        return (
-            isinstance(self.type, NonNullType) and self._default_value is _UNSET
-        )
+        # Not cached as `type` can be reassigned (e.g. `fix_type_references`).
+        return type(self.type) is NonNullType and not self.has_default_value
 
 
 class InputField(InputValue):
@@ -191,6 +197,8 @@ class InputField(InputValue):
             Source node used when building type from the SDL
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "InputField(%s: %s)" % (self.name, self.type)
 
@@ -219,7 +227,7 @@ class InputObjectType(NamedType):
 
         description (Optional[str]): Type description
 
-        nodes (List[\
+        nodes (Sequence[\
             Union[\
                 py_gql.lang.ast.InputObjectTypeDefinition,\
                 py_gql.lang.ast.InputObjectTypeExtension,\
@@ -231,13 +239,17 @@ class InputObjectType(NamedType):
         field_map (Dict[str, InputField]): Object fields as a map.
     """
 
+    fields = lazy_attribute(
+        "fields", "_source_fields", list
+    )  # type: Sequence[InputField]
+
     def __init__(
         self,
         name: str,
         fields: LazySeq[InputField],
         description: Optional[str] = None,
         nodes: Optional[
-            List[
+            Sequence[
                 Union[
                     _ast.InputObjectTypeDefinition,
                     _ast.InputObjectTypeExtension,
@@ -248,24 +260,21 @@ class InputObjectType(NamedType):
         self.name = name
         self.description = description
         self._source_fields = fields
-        self._fields = None  # type: Optional[Sequence[InputField]]
         self.nodes = (
-            [] if nodes is None else nodes
-        )  # noqa: B950, type: List[Union[_ast.InputObjectTypeDefinition, _ast.InputObjectTypeExtension]]
-
-    @property
-    def fields(self) -> Sequence[InputField]:
-        if self._fields is None:
-            self._fields = lazy(self._source_fields) or []
-        return self._fields
+            () if nodes is None else nodes
+        )  # noqa: B950, type: Sequence[Union[_ast.InputObjectTypeDefinition, _ast.InputObjectTypeExtension]]
 
-    @fields.setter
-    def fields(self, fields: List[InputField]) -> None:
-        self._fields = self._source_fields = fields
+    _field_map = None  # type: Optional[Dict[str, InputField]]
+    _field_map_source = None  # type: Optional[Sequence[InputField]]
 
     @property
     def field_map(self) -> Dict[str, InputField]:
-        return {f.name: f for f in self.fields}
+        # See GraphQLCompositeType.field_map.
+        fields = self.fields
+        if self._field_map is None or self._field_map_source is not fields:
+            self._field_map = {f.name: f for f in fields}
+            self._field_map_source = fields
+        return self._field_map
 
 
 _EV = TypeVar("_EV", bound="EnumValue")
@@ -389,13 +398,22 @@ class EnumType(GraphQLLeafType, NamedType):
 
         description (Optional[str]): Enum description
 
-        nodes (List[Union[\
+        nodes (Sequence[Union[\
             py_gql.lang.ast.EnumTypeDefinition, \
             py_gql.lang.ast.EnumTypeExtension,\
         ]]):
             Source nodes used when building type from the SDL
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "nodes",
+        "values",
+        "_values",
+        "_reverse_values",
+    )
+
     @classmethod
     def from_python_enum(cls, enum, description=None, nodes=None):
         """
@@ -414,32 +432,37 @@ class EnumType(GraphQLLeafType, NamedType):
         values: Iterable[Union[EnumValue, str, Tuple[str, Any]]],
         description: Optional[str] = None,
         nodes: Optional[
-            List[Union[_ast.EnumTypeDefinition, _ast.EnumTypeExtension]]
+            Sequence[Union[_ast.EnumTypeDefinition, _ast.EnumTypeExtension]]
         ] = None,
     ):
         self.name = name
         self.description = description
         self.nodes = (
-            [] if nodes is None else nodes
-        )  # type: List[Union[_ast.EnumTypeDefinition, _ast.EnumTypeExtension]]
+            () if nodes is None else nodes
+        )  # type: Sequence[Union[_ast.EnumTypeDefinition, _ast.EnumTypeExtension]]
 
         self._set_values(values)
 
     def _set_values(
         self, values: Iterable[Union[EnumValue, str, Tuple[str, Any]]]
     ) -> None:
-        self.values = []  # type: List[EnumValue]
-        self._values = {}  # type: Dict[str, EnumValue]
-        self._reverse_values = {}  # type: Dict[Any, EnumValue]
+        enum_values = []  # type: List[EnumValue]
+        by_name = {}  # type: Dict[str, EnumValue]
+        by_value = {}  # type: Dict[Any, EnumValue]
 
         for v in values:
             v = EnumValue.from_def(v)
 
-            if v.name in self._values:
+            # Insert and check for duplicates with a single lookup.
+            if by_name.setdefault(v.name, v) is not v:
                 raise ValueError("Duplicate enum value %s" % v.name)
 
-            self.values.append(v)
-            self._reverse_values[v.value] = self._values[v.name] = v
+            enum_values.append(v)
+            by_value[v.value] = v
+
+        self.values = enum_values
+        self._values = by_name
+        self._reverse_values = by_value
 
     def get_value(self, name: str) -> Any:
         """
@@ -454,12 +477,12 @@ class EnumType(GraphQLLeafType, NamedType):
         Raises:
             UnknownEnumValue: when the name is unknown.
         """
-        try:
-            return self._values[name].value
-        except KeyError:
+        enum_value = self._values.get(name)
+        if enum_value is None:
             raise UnknownEnumValue(
                 "Invalid name %s for enum %s" % (name, self.name)
             )
+        return enum_value.value
 
     def get_name(self, value: Any) -> str:
         """
@@ -474,12 +497,12 @@ class EnumType(GraphQLLeafType, NamedType):
         Raises:
             UnknownEnumValue: when the value is unknown
         """
-        try:
-            return self._reverse_values[value].name
-        except KeyError:
+        enum_value = self._reverse_values.get(value)
+        if enum_value is None:
             raise UnknownEnumValue(
                 "Invalid value %r for enum %s" % (value, self.name)
             )
+        return enum_value.name
 
 
 _ScalarValueNode = Union[
@@ -542,7 +565,7 @@ class ScalarType(GraphQLLeafType, NamedType):
 
         description (Optional[str]): Type description
 
-        nodes (List[Union[\
+        nodes (Sequence[Union[\
             py_gql.lang.ast.ScalarTypeDefinition, \
             py_gql.lang.ast.ScalarTypeExtension\
         ]]):
@@ -550,6 +573,15 @@ class ScalarType(GraphQLLeafType, NamedType):
 
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "nodes",
+        "_serialize",
+        "_parse",
+        "_parse_literal",
+    )
+
     def __init__(
         self,
         name: str,
@@ -560,7 +592,7 @@ class ScalarType(GraphQLLeafType, NamedType):
         ] = None,
         description: Optional[str] = None,
         nodes: Optional[
-            List[Union[_ast.ScalarTypeDefinition, _ast.ScalarTypeExtension]]
+            Sequence[Union[_ast.ScalarTypeDefinition, _ast.ScalarTypeExtension]]
         ] = None,
     ):
         self.name = name
@@ -569,8 +601,8 @@ class ScalarType(GraphQLLeafType, NamedType):
         self._parse = parse
         self._parse_literal = parse_literal
         self.nodes = (
-            [] if nodes is None else nodes
-        )  # type: List[Union[_ast.ScalarTypeDefinition, _ast.ScalarTypeExtension]]
+            () if nodes is None else nodes
+        )  # type: Sequence[Union[_ast.ScalarTypeDefinition, _ast.ScalarTypeExtension]]
 
     def serialize(self, value: Any) -> _ScalarValue:
         """
@@ -629,13 +661,12 @@ class ScalarType(GraphQLLeafType, NamedType):
             ScalarParsingError: when the type's parser fail with
                 ValueError or TypeError (other exceptions bubble up).
         """
+        # Subclasses are not required to call `ScalarType.__init__`.
+        parse_literal = getattr(self, "_parse_literal", None)
         try:
-            try:
-                if self._parse_literal is not None:
-                    return self._parse_literal(node, variables or {})
-                return self.parse(node.value)
-            except AttributeError:
-                return self.parse(node.value)
+            if parse_literal is not None:
+                return parse_literal(node, variables or {})
+            return self.parse(node.value)
         except (ValueError, TypeError) as err:
             raise ScalarParsingError(str(err), [node]) from err
 
@@ -681,6 +712,8 @@ class Argument(InputValue):
             Source node used when building type from the SDL
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "Argument(%s: %s)" % (self.name, self.type)
 
@@ -735,6 +768,27 @@ class Field:
 
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "deprecated",
+        "deprecation_reason",
+        "resolver",
+        "subscription_resolver",
+        "_source_args",
+        "node",
+        "_ltype",
+        "python_name",
+        "_argument_map",
+        "_argument_map_source",
+        "__dict__",
+    )
+
+    type = lazy_attribute("type", "_ltype")  # type: GraphQLType
+    arguments = lazy_attribute(
+        "arguments", "_source_args", list
+    )  # type: Sequence[Argument]
+
     def __init__(
         self,
         name: str,
@@ -754,35 +808,24 @@ class Field:
         self.resolver = resolver
         self.subscription_resolver = subscription_resolver
         self._source_args = args
-        self._args = None  # type: Optional[Sequence[Argument]]
         self.node = node
         self._ltype = type_
-        self._type = None  # type: Optional[GraphQLType]
         self.python_name = python_name or name
-
-    @property
-    def type(self) -> GraphQLType:
-        if self._type is None:
-            self._type = lazy(self._ltype)
-        return self._type
-
-    @type.setter
-    def type(self, type_: GraphQLType) -> None:
-        self._type = self._ltype = type_
-
-    @property
-    def arguments(self) -> Sequence[Argument]:
-        if self._args is None:
-            self._args = lazy(self._source_args) or []
-        return self._args
-
-    @arguments.setter
-    def arguments(self, args: List[Argument]) -> None:
-        self._args = self._source_args = args
+        self._argument_map = None  # type: Optional[Dict[str, Argument]]
+        self._argument_map_source = None  # type: Optional[Sequence[Argument]]
 
     @property
     def argument_map(self) -> Dict[str, Argument]:
-        return {arg.name: arg for arg in self.arguments}
+        # Memoized against the identity of `arguments` so that assigning new
+        # arguments invalidates it.
+        arguments = self.arguments
+        if (
+            self._argument_map is None
+            or self._argument_map_source is not arguments
+        ):
+            self._argument_map = {arg.name: arg for arg in arguments}
+            self._argument_map_source = arguments
+        return self._argument_map
 
     def __str__(self) -> str:
         return "Field(%s: %s)" % (self.name, self.type)
@@ -823,7 +866,7 @@ class InterfaceType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
 
         resolve_type (Optional[callable]): Type resolver
 
-        nodes (List[Union[\
+        nodes (Sequence[Union[\
             py_gql.lang.ast.InterfaceTypeDefinition,\
             py_gql.lang.ast.InterfaceTypeExtension,\
         ]]):
@@ -837,7 +880,7 @@ class InterfaceType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
         resolve_type: Optional[TypeResolver] = None,
         description: Optional[str] = None,
         nodes: Optional[
-            List[
+            Sequence[
                 Union[_ast.InterfaceTypeDefinition, _ast.InterfaceTypeExtension]
             ]
         ] = None,
@@ -845,10 +888,9 @@ class InterfaceType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
         self.name = name
         self.description = description
         self._source_fields = fields
-        self._fields = None  # type: Optional[Sequence[Field]]
         self.nodes = (
-            [] if nodes is None else nodes
-        )  # noqa: B950, type: List[Union[_ast.InterfaceTypeDefinition, _ast.InterfaceTypeExtension]]
+            () if nodes is None else nodes
+        )  # noqa: B950, type: Sequence[Union[_ast.InterfaceTypeDefinition, _ast.InterfaceTypeExtension]]
         self.resolve_type = resolve_type
 
 
@@ -887,13 +929,17 @@ class ObjectType(GraphQLCompositeType, NamedType):
 
         default_resolver (Optional[Callable[..., Any]]):
 
-        nodes (List[Union[\
+        nodes (Sequence[Union[\
             py_gql.lang.ast.ObjectTypeDefinition,\
             py_gql.lang.ast.ObjectTypeExtension,\
         ]]):
             Source nodes used when building type from the SDL
     """
 
+    interfaces = lazy_attribute(
+        "interfaces", "_source_interfaces", list
+    )  # type: Sequence[InterfaceType]
+
     def __init__(
         self,
         name: str,
@@ -902,30 +948,17 @@ class ObjectType(GraphQLCompositeType, NamedType):
         default_resolver: Optional[Resolver] = None,
         description: Optional[str] = None,
         nodes: Optional[
-            List[Union[_ast.ObjectTypeDefinition, _ast.ObjectTypeExtension]]
+            Sequence[Union[_ast.ObjectTypeDefinition, _ast.ObjectTypeExtension]]
         ] = None,
     ):
         self.name = name
         self.description = description
         self._source_fields = fields
-        self._source_fields = fields
         self.default_resolver = default_resolver
-        self._fields = None  # type: Optional[Sequence[Field]]
         self._source_interfaces = interfaces
-        self._interfaces = None  # type: Optional[Sequence[InterfaceType]]
         self.nodes = (
-            [] if nodes is None else nodes
-        )  # type: List[Union[_ast.ObjectTypeDefinition, _ast.ObjectTypeExtension]]
-
-    @property
-    def interfaces(self) -> Sequence[InterfaceType]:
-        if self._interfaces is None:
-            self._interfaces = lazy(self._source_interfaces) or []
-        return self._interfaces
-
-    @interfaces.setter
-    def interfaces(self, interfaces: List[InterfaceType]) -> None:
-        self._interfaces = self._source_interfaces = interfaces
+            () if nodes is None else nodes
+        )  # type: Sequence[Union[_ast.ObjectTypeDefinition, _ast.ObjectTypeExtension]]
 
 
 class UnionType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
@@ -956,7 +989,7 @@ class UnionType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
 
         types (Sequence[ObjectType]): Member types.
 
-        nodes (List[Union[\
+        nodes (Sequence[Union[\
             py_gql.lang.ast.UnionTypeDefinition,\
             py_gql.lang.ast.UnionTypeExtension,\
         ]]):
@@ -964,6 +997,10 @@ class UnionType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
 
     """
 
+    types = lazy_attribute(
+        "types", "_source_types", list
+    )  # type: Sequence[ObjectType]
+
     def __init__(
         self,
         name: str,
@@ -971,28 +1008,17 @@ class UnionType(GraphQLCompositeType, GraphQLAbstractType, NamedType):
         resolve_type: Optional[TypeResolver] = None,
         description: Optional[str] = None,
         nodes: Optional[
-            List[Union[_ast.UnionTypeDefinition, _ast.UnionTypeExtension]]
+            Sequence[Union[_ast.UnionTypeDefinition, _ast.UnionTypeExtension]]
         ] = None,
     ):
         self.name = name
         self.description = description
         self._source_types = types
-        self._types = None  # type: Optional[Sequence[ObjectType]]
         self.nodes = (
-            [] if nodes is None else nodes
-        )  # type: List[Union[_ast.UnionTypeDefinition, _ast.UnionTypeExtension]]
+            () if nodes is None else nodes
+        )  # type: Sequence[Union[_ast.UnionTypeDefinition, _ast.UnionTypeExtension]]
         self.resolve_type = resolve_type
 
-    @property
-    def types(self) -> Sequence[ObjectType]:
-        if self._types is None:
-            self._types = lazy(self._source_types) or []
-        return self._types
-
-    @types.setter
-    def types(self, types: List[ObjectType]) -> None:
-        self._types = self._source_types = types
-
 
 class Directive:
     """
@@ -1030,6 +1056,16 @@ class Directive:
             Source node used when building type from the SDL
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "locations",
+        "arguments",
+        "node",
+        "_argument_map",
+        "_argument_map_source",
+    )
+
     ALL_LOCATIONS = DIRECTIVE_LOCATIONS
     RUNTIME_LOCATIONS = RUNTIME_DIRECTIVE_LOCATIONS
     SCHEMA_LOCATONS = SCHEMA_DIRECTIVE_LOCATONS
@@ -1055,8 +1091,32 @@ class Directive:
         self.description = description
         self.locations = locations
         self.arguments = args if args is not None else []
-        self.argument_map = {arg.name: arg for arg in self.arguments}
         self.node = node
+        self._argument_map = None  # type: Optional[Dict[str, Argument]]
+        self._argument_map_source = None  # type: Optional[List[Argument]]
+
+    @property
+    def argument_map(self) -> Dict[str, Argument]:
+        # See Field.argument_map.
+        arguments = self.arguments
+        if (
+            self._argument_map is None
+            or self._argument_map_source is not arguments
+        ):
+            self._argument_map = {arg.name: arg for arg in arguments}
+            self._argument_map_source = arguments
+        return self._argument_map
+
+    @argument_map.setter
+    def argument_map(self, value: Dict[str, Argument]) -> None:
+        # Kept assignable as this used to be a plain attribute.
+        self.arguments = list(value.values())
+        self._argument_map = value
+        self._argument_map_source = self.arguments
+
+
+_INPUT_TYPES = (ScalarType, EnumType, InputObjectType)
+_OUTPUT_TYPES = (ScalarType, EnumType, ObjectType, InterfaceType, UnionType)
 
 
 def is_input_type(type_: GraphQLType) -> bool:
@@ -1065,9 +1125,9 @@ def is_input_type(type_: GraphQLType) -> bool:
 
     These types may be used as input types for arguments and directives.
     """
-    return isinstance(
-        unwrap_type(type_), (ScalarType, EnumType, InputObjectType)
-    )
+    named = unwrap_type(type_)
+    # Exact class lookup first, scalars can be subclassed.
+    return type(named) in _INPUT_TYPES or isinstance(named, _INPUT_TYPES)
 
 
 def is_output_type(type_: GraphQLType) -> bool:
@@ -1076,18 +1136,18 @@ def is_output_type(type_: GraphQLType) -> bool:
 
     These types may be used as output types as the result of fields.
     """
-    return isinstance(
-        unwrap_type(type_),
-        (ScalarType, EnumType, ObjectType, InterfaceType, UnionType),
-    )
+    named = unwrap_type(type_)
+    # Exact class lookup first, scalars can be subclassed.
+    return type(named) in _OUTPUT_TYPES or isinstance(named, _OUTPUT_TYPES)
 
 
 def unwrap_type(type_: GraphQLType) -> NamedType:
     """
-    Recursively extract inner type from a potentially wrapping type like
-    `ListType` or `NonNullType`.
+    Extract inner type from a potentially wrapping type like `ListType` or
+    `NonNullType`.
     """
     cur = type_
-    while isinstance(cur, (ListType, NonNullType)):
+    # Wrapping types are not meant to be subclassed, see `Executor.complete_value`.
+    while type(cur) is NonNullType or type(cur) is ListType:
         cur = cur.type
     return cast(NamedType, cur)
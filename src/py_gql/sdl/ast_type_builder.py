@@ -370,7 +370,7 @@ class ASTTypeBuilder:
             description=object_type.description,
             fields=fields,
             interfaces=interfaces,
-            nodes=object_type.nodes + extensions,  # type: ignore
+            nodes=list(object_type.nodes) + extensions,  # type: ignore
         )
 
     def _extend_field(self, field_def: Field) -> Field:
@@ -408,7 +408,7 @@ class ASTTypeBuilder:
             name,
             description=interface_type.description,
             fields=fields,
-            nodes=interface_type.nodes + extensions,  # type: ignore
+            nodes=list(interface_type.nodes) + extensions,  # type: ignore
         )
 
     def _extend_enum_type(self, enum_type: EnumType) -> EnumType:
@@ -433,7 +433,7 @@ class ASTTypeBuilder:
             name,
             description=enum_type.description,
             values=values,
-            nodes=enum_type.nodes + extensions,  # type: ignore
+            nodes=list(enum_type.nodes) + extensions,  # type: ignore
         )
 
     def _extend_union_type(self, union_type: UnionType) -> UnionType:
@@ -463,7 +463,7 @@ class ASTTypeBuilder:
         return UnionType(
             name,
             types=member_types,
-            nodes=union_type.nodes + extensions,  # type: ignore
+            nodes=list(union_type.nodes) + extensions,  # type: ignore
         )
 
     def _extend_input_object_type(
@@ -501,7 +501,7 @@ class ASTTypeBuilder:
             name,
             description=input_object_type.description,
             fields=fields,
-            nodes=input_object_type.nodes + extensions,  # type: ignore
+            nodes=list(input_object_type.nodes) + extensions,  # type: ignore
         )
 
     def _extend_scalar_type(self, scalar_type: ScalarType) -> ScalarType:
@@ -514,7 +514,7 @@ class ASTTypeBuilder:
             serialize=scalar_type._serialize,
             parse=scalar_type._parse,
             parse_literal=scalar_type._parse_literal,
-            nodes=scalar_type.nodes + extensions,  # type: ignore
+            nodes=list(scalar_type.nodes) + extensions,  # type: ignore
         )
 
     def _extend_argument(self, argument: Argument) -> Argument:
@@ -35,6 +35,8 @@ from .value_from_ast import value_from_ast
 
 Path = List[Union[int, str]]
 
+_UNSET = object()
+
 
 def _path(path):
     if not path:
@@ -149,11 +151,13 @@ def _coerce_input_object(
 
     coerced = {}
     errors = []
+    provided = 0
 
     for field in type_.fields:
         field_name = field.name
+        field_value = value.get(field_name, _UNSET)
 
-        if field_name not in value:
+        if field_value is _UNSET:
             if isinstance(field.type, NonNullType):
                 errors.append(
                     CoercionError(
@@ -164,9 +168,10 @@ def _coerce_input_object(
                     )
                 )
         else:
+            provided += 1
             try:
                 coerced[field.python_name] = coerce_value(
-                    value[field_name], field.type, node, path + [field_name]
+                    field_value, field.type, node, path + [field_name]
                 )
             except MultiCoercionError as err:
                 for child_err in err.errors:
@@ -179,13 +184,16 @@ def _coerce_input_object(
     elif len(errors) == 1:
         raise errors[0]
 
-    for fieldname in value.keys():
-        if fieldname not in type_.field_map:
-            raise CoercionError(
-                "Field %s is not defined by type %s" % (fieldname, type_),
-                node,
-                value_path=_path(path),
-            )
+    # Every key matched a field: there can't be any unknown field.
+    if provided != len(value):
+        field_map = type_.field_map
+        for fieldname in value.keys():
+            if fieldname not in field_map:
+                raise CoercionError(
+                    "Field %s is not defined by type %s" % (fieldname, type_),
+                    node,
+                    value_path=_path(path),
+                )
 
     return coerced
 
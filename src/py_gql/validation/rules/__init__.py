@@ -478,7 +478,33 @@ class NoFragmentCyclesChecker(ValidationVisitor):
             if name not in self._spreads[self._current]:
                 self._spreads[self._current].append(name)
 
+    def _reaching_cycles(self):
+        # Fragments which can reach a cycle, found by repeatedly discarding
+        # fragments which only spread already discarded (or unknown)
+        # fragments. This is linear and usually discards every fragment, in
+        # which case there is nothing left to search.
+        dependants = defaultdict(list)  # type: Dict[str, List[str]]
+        pending = {}  # type: Dict[str, int]
+        for outer, inners in self._spreads.items():
+            known = [inner for inner in inners if inner in self._spreads]
+            pending[outer] = len(known)
+            for inner in known:
+                dependants[inner].append(outer)
+
+        acyclic = [name for name, count in pending.items() if not count]
+        while acyclic:
+            for dependant in dependants[acyclic.pop()]:
+                pending[dependant] -= 1
+                if not pending[dependant]:
+                    acyclic.append(dependant)
+
+        return {name for name, count in pending.items() if count}
+
     def leave_document(self, node):
+        candidates = self._reaching_cycles()
+        if not candidates:
+            return
+
         def _search(outer, acc=None, path=None):
             acc, path = acc or dict(), path or []
 
@@ -496,7 +522,11 @@ class NoFragmentCyclesChecker(ValidationVisitor):
 
             return acc
 
-        flat_spreads = [(outer, _search(outer)) for outer in self._spreads]
+        flat_spreads = [
+            (outer, _search(outer))
+            for outer in self._spreads
+            if outer in candidates
+        ]
         cyclic = set()
 
         for outer, inner_spreads in flat_spreads:
@@ -734,7 +764,6 @@ class UniqueDirectivesPerLocationChecker(ValidationVisitor):
 
     enter_operation_definition = _validate_unique_directive_names
     enter_field = _validate_unique_directive_names
-    enter_field = _validate_unique_directive_names
     enter_fragment_spread = _validate_unique_directive_names
     enter_inline_fragment = _validate_unique_directive_names
     enter_fragment_definition = _validate_unique_directive_names
@@ -748,8 +777,8 @@ class KnownArgumentNamesChecker(ValidationVisitor):
 
     def enter_field(self, node):
         field_def = self.type_info.field
-        if field_def is not None:
-            known = set((a.name for a in field_def.arguments))
+        if field_def is not None and node.arguments:
+            known = field_def.argument_map
             for arg in node.arguments:
                 name = arg.name.value
                 if name not in known:
@@ -779,8 +808,8 @@ class KnownArgumentNamesChecker(ValidationVisitor):
 
     def enter_directive(self, node):
         directive_def = self.type_info.directive
-        if directive_def is not None:
-            known = set((a.name for a in directive_def.arguments))
+        if directive_def is not None and node.arguments:
+            known = directive_def.argument_map
             for arg in node.arguments:
                 name = arg.name.value
                 if name not in known:
@@ -1,25 +1,41 @@
 # -*- coding: utf-8 -*-
 
+import functools
+import itertools
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
     Optional,
     Sequence,
+    Set,
+    Tuple,
     Type,
+    TypeVar,
 )
 
 from ..exc import ValidationError
 from ..lang import ast as _ast
-from ..lang.visitor import ChainedVisitor
+from ..lang.visitor import (
+    _HANDLER_NAMES,
+    ASTVisitor,
+    ChainedVisitor,
+    DispatchingVisitor,
+    SkipNode,
+)
 from ..schema import Schema
 from . import rules as _rules
 from .visitors import TypeInfoVisitor, ValidationVisitor
 
 
+N = TypeVar("N", bound=_ast.Node)
+
+_Handlers = Tuple[Sequence[Callable[..., Any]], Sequence[Callable[..., Any]]]
+
 Validator = Callable[
     [Schema, _ast.Document, Optional[Dict[str, Any]]], Iterable[ValidationError]
 ]
@@ -72,6 +88,175 @@ class ValidationResult:
         return iter(self.errors)
 
 
+_VALUES = (
+    _ast.Variable,
+    _ast.IntValue,
+    _ast.FloatValue,
+    _ast.StringValue,
+    _ast.BooleanValue,
+    _ast.NullValue,
+    _ast.EnumValue,
+    _ast.ListValue,
+    _ast.ObjectValue,
+)  # type: Tuple[type, ...]
+
+_TYPES = (
+    _ast.NamedType,
+    _ast.ListType,
+    _ast.NonNullType,
+)  # type: Tuple[type, ...]
+
+# Node classes which can be visited below each executable node class, as
+# traversed by `ASTVisitor`. Type system nodes are not listed and are never
+# skipped.
+_CHILD_NODE_CLASSES = {
+    _ast.OperationDefinition: (
+        _ast.VariableDefinition,
+        _ast.Directive,
+        _ast.SelectionSet,
+    ),
+    _ast.FragmentDefinition: (_ast.Directive, _ast.SelectionSet),
+    _ast.VariableDefinition: _VALUES + _TYPES,
+    _ast.Directive: (_ast.Argument,),
+    _ast.Argument: _VALUES,
+    _ast.SelectionSet: (_ast.Field, _ast.FragmentSpread, _ast.InlineFragment),
+    _ast.Field: (_ast.Argument, _ast.Directive, _ast.SelectionSet),
+    _ast.FragmentSpread: (_ast.Directive,),
+    _ast.InlineFragment: (_ast.Directive, _ast.SelectionSet),
+    _ast.ListValue: _VALUES,
+    _ast.ObjectValue: (_ast.ObjectField,),
+    _ast.ObjectField: _VALUES,
+}  # type: Dict[type, Tuple[type, ...]]
+
+for _leaf in _VALUES + _TYPES:
+    _CHILD_NODE_CLASSES.setdefault(_leaf, ())
+
+
+def _subtree_node_classes(node_cls: type) -> Set[type]:
+    seen = {node_cls}
+    stack = [node_cls]
+    while stack:
+        for child in _CHILD_NODE_CLASSES[stack.pop()]:
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+    return seen
+
+
+@functools.lru_cache(maxsize=256)
+def _handler_indices(
+    visitor_classes: Tuple[type, ...], node_cls: type
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    # Positions of the visitors implementing the enter and leave handlers for
+    # a node class, in calling order. This only depends on the classes so it is
+    # shared across validations.
+    try:
+        enter_name, leave_name = _HANDLER_NAMES[node_cls]
+    except KeyError:
+        raise TypeError(node_cls)
+
+    default_enter = getattr(DispatchingVisitor, enter_name)
+    default_leave = getattr(DispatchingVisitor, leave_name)
+    indices = range(len(visitor_classes))
+
+    return (
+        tuple(
+            i
+            for i in indices
+            if getattr(visitor_classes[i], enter_name) is not default_enter
+        ),
+        tuple(
+            i
+            for i in reversed(indices)
+            if getattr(visitor_classes[i], leave_name) is not default_leave
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _skipped_node_classes(visitor_classes: Tuple[type, ...]) -> FrozenSet[type]:
+    # Executable node classes for which no visitor implements a handler
+    # anywhere in their subtree. Type info tracking is balanced within a
+    # subtree so skipping it entirely doesn't affect other nodes.
+    handled = {
+        node_cls
+        for node_cls in _HANDLER_NAMES
+        if any(_handler_indices(visitor_classes, node_cls))
+    }
+    return frozenset(
+        node_cls
+        for node_cls in _CHILD_NODE_CLASSES
+        if not (handled & _subtree_node_classes(node_cls))
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _supports_single_pass(
+    visitor_classes: Tuple[Type[ValidationVisitor], ...]
+) -> bool:
+    return all(
+        cls.enter is ValidationVisitor.enter
+        and cls.leave is DispatchingVisitor.leave
+        for cls in visitor_classes
+    )
+
+
+class _RulesVisitor(ASTVisitor):
+    """
+    Single pass equivalent of ``ChainedVisitor(type_info, *visitors)``.
+
+    The handlers to call are resolved once per node class and the ones left to
+    their default no-op implementation are skipped entirely, which avoids
+    dispatching every node to every rule. Subtrees which no rule is interested
+    in are not traversed. Which rules implement which handlers is cached per
+    set of rule classes.
+
+    This is only valid for visitors which rely on the default ``enter`` and
+    ``leave`` dispatching of :class:`ValidationVisitor`.
+    """
+
+    def __init__(
+        self,
+        type_info: TypeInfoVisitor,
+        visitors: Sequence[ValidationVisitor],
+        visitor_classes: Tuple[type, ...],
+    ):
+        self.type_info = type_info
+        self.visitors = visitors
+        self._visitor_classes = visitor_classes
+        self._handlers = {}  # type: Dict[type, _Handlers]
+        self._skipped = _skipped_node_classes(visitor_classes)
+
+    def _resolve(self, node_cls: type) -> _Handlers:
+        try:
+            return self._handlers[node_cls]
+        except KeyError:
+            pass
+
+        visitors = self.visitors
+        enter, leave = _handler_indices(self._visitor_classes, node_cls)
+        enter_name, leave_name = _HANDLER_NAMES[node_cls]
+        handlers = self._handlers[node_cls] = (
+            [getattr(visitors[i], enter_name) for i in enter],
+            [getattr(visitors[i], leave_name) for i in leave],
+        )
+        return handlers
+
+    def enter(self, node: N) -> N:
+        if node.__class__ in self._skipped:
+            raise SkipNode()
+        if self.type_info.enter(node) is not None:
+            # Return values are ignored as in `ValidationVisitor.enter`.
+            for handler in self._resolve(node.__class__)[0]:
+                handler(node)
+        return node
+
+    def leave(self, node: _ast.Node) -> None:
+        for handler in self._resolve(node.__class__)[1]:
+            handler(node)
+        self.type_info.leave(node)
+
+
 def default_validator(
     schema: Schema,
     document: _ast.Document,
@@ -95,13 +280,22 @@ def default_validator(
     type_info = TypeInfoVisitor(schema)
 
     visitors = [cls(schema, type_info) for cls in validators]
+    visitor_classes = tuple(type(v) for v in visitors)
 
     # Type info NEEDS to be first to be accurately used inside other validators
     # so when a validator enters node the type stack has already been updated.
-    validator = ChainedVisitor(type_info, *visitors)
+    validator = (
+        _RulesVisitor(type_info, visitors, visitor_classes)
+        if _supports_single_pass(visitor_classes)
+        else ChainedVisitor(type_info, *visitors)
+    )  # type: ASTVisitor
     validator.visit(document)
 
-    return [error for visitor in visitors for error in visitor.errors]
+    return list(itertools.chain.from_iterable(v.errors for v in visitors))
+
+
+# Built once instead of on every call to `validate_ast`.
+_DEFAULT_VALIDATORS = (default_validator,)  # type: Sequence[Validator]
 
 
 def validate_ast(
@@ -134,12 +328,13 @@ def validate_ast(
 
     """
     if validators is None:
-        validators = [default_validator]
+        validators = _DEFAULT_VALIDATORS
 
     return ValidationResult(
-        [
-            error
-            for validator in validators
-            for error in validator(schema, document, variables)
-        ]
+        list(
+            itertools.chain.from_iterable(
+                validator(schema, document, variables)
+                for validator in validators
+            )
+        )
     )
@@ -188,11 +188,19 @@ class VariablesCollector(ValidationVisitor):
             )
 
     def _flatten_fragments(self):
-        for parent, children in self._fragment_fragments.items():
-            for child in deduplicate(children):
-                for op in self._op_fragments.keys():
-                    if parent in self._op_fragments[op]:
-                        self._op_fragments[op].append(child)
+        # Replace the fragments spread directly by each operation with all
+        # the fragments it references, directly or through other fragments.
+        for op, fragments in self._op_fragments.items():
+            flat = list(deduplicate(fragments))
+            seen = set(flat)
+            # `flat` is extended while iterating so nested spreads are
+            # followed until no new fragment is found.
+            for fragment in flat:
+                for child in self._fragment_fragments.get(fragment, ()):
+                    if child not in seen:
+                        seen.add(child)
+                        flat.append(child)
+            fragments[:] = flat
 
     def leave_document(self, _):
         self._flatten_fragments()
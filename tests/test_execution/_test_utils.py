@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import functools
 import pprint
+from collections import Counter
 from concurrent.futures import Future
 from inspect import isawaitable
 from typing import Any, List, Optional, Tuple, Type, Union
@@ -44,30 +46,39 @@ def assert_execution_result(
         for err in (errors or [])
     ]
 
-    # Prints out in failed tests when running with -vv
-    print("Result:")
-    print("-------")
-    pprint.pprint(data)
-    pprint.pprint(simplified_errors)
+    try:
+        if expected_data is not None:
+            assert expected_data == data
 
-    print("Expected:")
-    print("---------")
-    pprint.pprint(expected_data)
-    pprint.pprint(expected_errors)
+        if expected_errors:
+            assert Counter(expected_errors) == Counter(simplified_errors)
+        else:
+            assert not errors
+    except AssertionError:
+        # Prints out in failed tests when running with -vv, only formatted on
+        # failure as pprint is slow on large results.
+        print("Result:")
+        print("-------")
+        pprint.pprint(data)
+        pprint.pprint(simplified_errors)
 
-    if expected_data is not None:
-        assert expected_data == data
+        print("Expected:")
+        print("---------")
+        pprint.pprint(expected_data)
+        pprint.pprint(expected_errors)
+        raise
 
-    if expected_errors:
-        assert set(expected_errors) == set(simplified_errors)
-    else:
-        assert not errors
+
+# Execution doesn't mutate documents so parametrized tests can share them.
+@functools.lru_cache(maxsize=1024)
+def _parse_dedented(doc: str) -> Document:
+    return parse(dedent(doc))
 
 
 def ensure_document(doc: Union[Document, str]) -> Document:
     if not isinstance(doc, Document):
         # Always dedent so results are consistent after reflowing multiline queries
-        return parse(dedent(doc))
+        return _parse_dedented(doc)
     return doc
 
 
@@ -12,6 +12,7 @@ from py_gql.schema import (
     ListType,
     NonNullType,
     ObjectType,
+    ScalarType,
     Schema,
     String,
 )
@@ -225,3 +226,36 @@ async def test_nullable_list_of_non_nullable_items_fail(
         expected_errors=[expected_err],
         assert_execution=assert_execution,
     )
+
+
+@pytest.mark.parametrize(
+    "test_type", [ListType(Int), ListType(NonNullType(Int))]
+)
+async def test_it_raises_on_invalid_list_entry(assert_execution, test_type):
+    await run_test(
+        test_type,
+        _lazy([1, "foo", 2]),
+        assert_execution=assert_execution,
+        expected_exc=RuntimeError,
+        expected_msg=(
+            'Field "nest.test[1]" cannot be serialized as "Int": '
+            "Int cannot represent non integer value: foo"
+        ),
+    )
+
+
+async def test_non_nullable_scalar_serialized_to_null_fails(assert_execution):
+    NullableInt = ScalarType(
+        "NullableInt",
+        lambda value: None if value == 0 else value,
+        lambda value: value,
+    )
+
+    await run_test(
+        ListType(NonNullType(NullableInt)),
+        [1, 0, 2],
+        expected_errors=[
+            ('Field "nest.test[1]" is not nullable', (9, 13), "nest.test[1]")
+        ],
+        assert_execution=assert_execution,
+    )
@@ -4,14 +4,22 @@ Test the main entry point.
 """
 
 import asyncio
+import hashlib
 
 import pytest
 
-from py_gql._graphql import graphql, graphql_blocking, process_graphql_query
-from py_gql.exc import ResolverError, SchemaError
+from py_gql._graphql import (
+    _parse_or_error,
+    graphql,
+    graphql_blocking,
+    process_graphql_query,
+)
+from py_gql.exc import ResolverError, SchemaError, ValidationError
+from py_gql.execution import Instrumentation
 from py_gql.execution.runtime import ThreadPoolRuntime
 from py_gql.schema import Schema, String
 from py_gql.sdl import build_schema
+from py_gql.validation import validate_ast
 
 
 async def _execute_query_blocking(*args, **kwargs):
@@ -355,3 +363,262 @@ async def test_graphql_with_async_resolvers():
             }
         ],
     } == result.response()
+
+
+def test_identical_documents_share_the_same_ast():
+    query = "query CachedParse { hero { name } }"
+    assert _parse_or_error(query) is _parse_or_error(query)
+
+
+def test_syntax_errors_are_cached(starwars_schema):
+    query = "query CachedSyntaxError {"
+
+    first = graphql_blocking(starwars_schema, query)
+    second = graphql_blocking(starwars_schema, query)
+
+    assert first.response() == second.response()
+    assert first.errors[0] is second.errors[0]
+
+
+def test_successful_validation_is_cached(starwars_schema, mocker):
+    validate = mocker.patch("py_gql._graphql.validate_ast", wraps=validate_ast)
+    query = "query CachedValidation { hero { name } }"
+
+    graphql_blocking(starwars_schema, query)
+    graphql_blocking(starwars_schema, query)
+
+    assert validate.call_count == 1
+
+
+def test_validation_errors_are_cached(starwars_schema, mocker):
+    validate = mocker.patch("py_gql._graphql.validate_ast", wraps=validate_ast)
+    query = "query CachedValidationErrors { hero { unknownField } }"
+
+    first = graphql_blocking(starwars_schema, query)
+    second = graphql_blocking(starwars_schema, query)
+
+    assert validate.call_count == 1
+    assert first.errors and first.errors == second.errors
+
+
+def test_prepared_documents_skip_parsing_and_validation(
+    starwars_schema, mocker
+):
+    query = "query PreparedDocument { hero { name } }"
+    first = graphql_blocking(starwars_schema, query)
+
+    parse = mocker.patch("py_gql._graphql._parse_or_error")
+    validate = mocker.patch("py_gql._graphql._cached_validate")
+    second = graphql_blocking(starwars_schema, query)
+
+    assert not parse.called
+    assert not validate.called
+    assert first.response() == second.response()
+
+
+def test_persisted_query_not_found(starwars_schema):
+    result = graphql_blocking(
+        starwars_schema, None, persisted_query_hash="unknown"
+    )
+    assert result.response() == {
+        "errors": [{"message": "PersistedQueryNotFound"}]
+    }
+
+
+def test_persisted_query_is_registered_and_reused(starwars_schema):
+    query = "query PersistedQuery { hero { name } }"
+    sha = hashlib.sha256(query.encode("utf8")).hexdigest()
+
+    first = graphql_blocking(starwars_schema, query, persisted_query_hash=sha)
+    second = graphql_blocking(starwars_schema, None, persisted_query_hash=sha)
+
+    assert first.response() == second.response()
+    assert second.response() == {"data": {"hero": {"name": "R2-D2"}}}
+
+
+def test_missing_document_and_hash_raises_before_instrumentation(
+    starwars_schema,
+):
+    calls = []
+
+    class CountingInstrumentation(Instrumentation):
+        def on_query_start(self):
+            calls.append("start")
+
+        def on_query_end(self):
+            calls.append("end")
+
+    with pytest.raises(ValueError):
+        graphql_blocking(
+            starwars_schema, None, instrumentation=CountingInstrumentation()
+        )
+
+    assert calls == []
+
+
+def test_persisted_query_hash_mismatch(starwars_schema):
+    result = graphql_blocking(
+        starwars_schema, "{ hero { name } }", persisted_query_hash="foo"
+    )
+    assert result.response() == {
+        "errors": [{"message": "Provided sha does not match query"}]
+    }
+
+
+@pytest.fixture
+def counting_schema():
+    schema = build_schema(
+        """
+        type Query {
+            foo(value: Int): Int
+        }
+
+        type Mutation {
+            bar: Int
+        }
+        """
+    )
+    calls = []
+
+    @schema.resolver("Query.foo")
+    async def resolve_foo(*_, value=None):
+        calls.append("foo")
+        await asyncio.sleep(0.001)
+        return value
+
+    @schema.resolver("Mutation.bar")
+    async def resolve_bar(*_):
+        calls.append("bar")
+        await asyncio.sleep(0.001)
+        return 42
+
+    return schema, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_are_coalesced(counting_schema):
+    schema, calls = counting_schema
+    query = "query ($value: Int) { foo(value: $value) }"
+
+    first, second = await asyncio.gather(
+        graphql(schema, query, variables={"value": 1}, coalesce=True),
+        graphql(schema, query, variables={"value": 1}, coalesce=True),
+    )
+
+    assert calls == ["foo"]
+    assert first.response() == second.response() == {"data": {"foo": 1}}
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_cancel_coalesced_callers(
+    counting_schema,
+):
+    schema, calls = counting_schema
+    query = "query ($value: Int) { foo(value: $value) }"
+
+    leader = asyncio.ensure_future(
+        graphql(schema, query, variables={"value": 1}, coalesce=True)
+    )
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(
+        graphql(schema, query, variables={"value": 1}, coalesce=True)
+    )
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    result = await follower
+
+    assert leader.cancelled()
+    assert calls == ["foo"]
+    assert result.response() == {"data": {"foo": 1}}
+
+
+@pytest.mark.asyncio
+async def test_queries_with_different_variables_are_not_coalesced(
+    counting_schema,
+):
+    schema, calls = counting_schema
+    query = "query ($value: Int) { foo(value: $value) }"
+
+    first, second = await asyncio.gather(
+        graphql(schema, query, variables={"value": 1}, coalesce=True),
+        graphql(schema, query, variables={"value": 2}, coalesce=True),
+    )
+
+    assert calls == ["foo", "foo"]
+    assert first.response() == {"data": {"foo": 1}}
+    assert second.response() == {"data": {"foo": 2}}
+
+
+@pytest.mark.asyncio
+async def test_queries_with_different_validators_are_not_coalesced(
+    counting_schema,
+):
+    schema, calls = counting_schema
+
+    def reject(schema, document, variables):
+        return [ValidationError("Rejected")]
+
+    first, second = await asyncio.gather(
+        graphql(schema, "{ foo }", coalesce=True),
+        graphql(schema, "{ foo }", validators=[reject], coalesce=True),
+    )
+
+    assert calls == ["foo"]
+    assert first.response() == {"data": {"foo": None}}
+    assert second.response() == {"errors": [{"message": "Rejected"}]}
+
+
+@pytest.mark.asyncio
+async def test_queries_with_different_persisted_hashes_are_not_coalesced(
+    counting_schema,
+):
+    schema, calls = counting_schema
+    query = "{ foo }"
+    query_hash = hashlib.sha256(query.encode("utf8")).hexdigest()
+
+    first, second = await asyncio.gather(
+        graphql(schema, query, persisted_query_hash="foo", coalesce=True),
+        graphql(schema, query, persisted_query_hash=query_hash, coalesce=True),
+    )
+
+    assert calls == ["foo"]
+    assert first.response() == {
+        "errors": [{"message": "Provided sha does not match query"}]
+    }
+    assert second.response() == {"data": {"foo": None}}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_do_not_share_data(counting_schema):
+    schema, _ = counting_schema
+
+    first, second = await asyncio.gather(
+        graphql(schema, "{ foo }", coalesce=True),
+        graphql(schema, "{ foo }", coalesce=True),
+    )
+
+    first.data["foo"] = 42
+    assert second.response() == {"data": {"foo": None}}
+
+
+@pytest.mark.asyncio
+async def test_mutations_are_not_coalesced(counting_schema):
+    schema, calls = counting_schema
+
+    await asyncio.gather(
+        graphql(schema, "mutation { bar }", coalesce=True),
+        graphql(schema, "mutation { bar }", coalesce=True),
+    )
+
+    assert calls == ["bar", "bar"]
+
+
+@pytest.mark.asyncio
+async def test_queries_are_not_coalesced_by_default(counting_schema):
+    schema, calls = counting_schema
+
+    await asyncio.gather(graphql(schema, "{ foo }"), graphql(schema, "{ foo }"))
+
+    assert calls == ["foo", "foo"]
@@ -14,15 +14,19 @@ from py_gql.exc import (
     ScalarSerializationError,
     UnknownEnumValue,
 )
-from py_gql.lang.parser import parse_value
+from py_gql.lang.parser import parse_type, parse_value
 from py_gql.schema import (
     UUID,
+    Argument,
     Boolean,
+    Directive,
     EnumType,
+    Field,
     Float,
     Int,
     ListType,
     NonNullType,
+    ObjectType,
     RegexType,
     String,
 )
@@ -36,6 +40,110 @@ def test_as_non_null():
     assert UUID.as_non_null() == NonNullType(UUID)
 
 
+def test_lazy_attributes_are_resolved_once(mocker):
+    get_fields = mocker.Mock(return_value=[Field("foo", lambda: String)])
+    obj = ObjectType("Object", get_fields)
+
+    assert obj.fields[0].type is String
+    assert obj.fields is obj.fields
+    assert get_fields.call_count == 1
+
+
+def test_lazy_attributes_can_be_overridden():
+    obj = ObjectType("Object", lambda: [Field("foo", String)])
+    field = Field("bar", String)
+    obj.fields = [field]
+    assert obj.fields == [field]
+
+    field.type = Int
+    assert field.type is Int
+
+
+def test_field_map_is_cached_until_fields_are_replaced():
+    obj = ObjectType("Object", [Field("foo", String)])
+    assert obj.field_map is obj.field_map
+
+    bar = Field("bar", String)
+    obj.fields = [bar]
+    assert obj.field_map == {"bar": bar}
+
+
+def test_argument_map_is_cached_until_arguments_are_replaced():
+    field = Field("foo", String, [Argument("a", Int)])
+    assert field.argument_map is field.argument_map
+
+    b = Argument("b", Int)
+    field.arguments = [b]
+    assert field.argument_map == {"b": b}
+
+
+def test_directive_argument_map_is_cached_until_arguments_are_replaced():
+    directive = Directive("foo", ["FIELD"], [Argument("a", Int)])
+    assert directive.argument_map is directive.argument_map
+
+    b = Argument("b", Int)
+    directive.arguments = [b]
+    assert directive.argument_map == {"b": b}
+
+
+def test_assigning_directive_argument_map_updates_arguments():
+    directive = Directive("foo", ["FIELD"], [Argument("a", Int)])
+    b = Argument("b", Int)
+    directive.argument_map = {"b": b}
+    assert directive.arguments == [b]
+    assert directive.argument_map == {"b": b}
+
+
+def test_empty_lazy_attributes_default_to_empty_list():
+    assert ObjectType("Object", lambda: None).interfaces == []
+
+
+def test_wrapping_types_are_compared_structurally():
+    assert ListType(NonNullType(Int)) == ListType(NonNullType(Int))
+    assert ListType(Int) != NonNullType(Int)
+    assert ListType(Int) != ListType(String)
+    assert ListType(Int) != Int
+    assert Int != ListType(Int)
+
+
+def test_wrapping_types_of_concrete_types_are_interned():
+    assert NonNullType(Int) is NonNullType(Int)
+    assert ListType(NonNullType(Int)) is Int.as_non_null().as_list()
+    assert ListType(Int) is not NonNullType(Int)
+
+
+def test_wrapping_types_type_is_read_only():
+    wrapped = NonNullType(String)
+    with pytest.raises(AttributeError):
+        wrapped.type = Int  # type: ignore
+    assert NonNullType(String).type is String
+
+
+def test_lazy_or_sdl_wrapping_types_are_not_interned():
+    assert NonNullType(lambda: Int) is not NonNullType(lambda: Int)
+    node = parse_type("Int!")
+    assert NonNullType(Int, node=node) is not NonNullType(Int)
+
+
+def test_required_is_updated_with_default_value():
+    arg = Argument("a", NonNullType(Int))
+    assert arg.required and not arg.has_default_value
+
+    arg.default_value = 42
+    assert not arg.required and arg.has_default_value
+
+    del arg.default_value
+    assert arg.required and not arg.has_default_value
+
+
+def test_required_is_updated_with_type():
+    arg = Argument("a", Int)
+    assert not arg.required
+
+    arg.type = NonNullType(Int)
+    assert arg.required
+
+
 def test_EnumType_rejects_duplicate_names():
     with pytest.raises(ValueError):
         EnumType("Enum", [("SOME_NAME", 1), ("SOME_NAME", 2)])
@@ -10,6 +10,7 @@ import pytest
 from py_gql.exc import SchemaError, SchemaValidationError
 from py_gql.schema import (
     Argument,
+    Directive,
     EnumType,
     EnumValue,
     Field,
@@ -896,3 +897,26 @@ class TestResolverValidation:
         schema.default_resolver = default_resolver
 
         validate_schema(schema)
+
+
+def test_validation_is_only_run_once(starwars_schema, mocker):
+    schema = starwars_schema.clone()
+    validate_schema = mocker.patch("py_gql.schema.schema.validate_schema")
+
+    schema.validate()
+    schema.validate()
+
+    assert validate_schema.call_count == 1
+
+
+def test_replacing_directives_invalidates_validation(starwars_schema, mocker):
+    schema = starwars_schema.clone()
+    validate_schema = mocker.patch("py_gql.schema.schema.validate_schema")
+
+    schema.validate()
+    schema._replace_types_and_directives(
+        directives={"foo": Directive("foo", ["FIELD"])}
+    )
+    schema.validate()
+
+    assert validate_schema.call_count == 2
@@ -230,3 +230,16 @@ def test_no_spreading_itself_deeply_and_immediately(schema):
             # 'Cannot spread fragment "fragB" withing itself (via: fragC)',
         ],
     )
+
+
+def test_spreading_into_a_cycle_only_reports_the_cycle(schema):
+    run_test(
+        NoFragmentCyclesChecker,
+        schema,
+        """
+        fragment fragA on Dog { ...fragB }
+        fragment fragB on Dog { ...fragC }
+        fragment fragC on Dog { ...fragB }
+        """,
+        ['Cannot spread fragment "fragB" withing itself (via: fragC)'],
+    )
@@ -360,3 +360,27 @@ def test_multiple_undefined_variables_produce_multiple_errors(schema):
             'Variable "$c" from fragment "FragC" is not defined on "Bar" operation',
         ],
     )
+
+
+def test_variable_in_fragments_defined_out_of_order_not_defined(schema):
+    run_test(
+        NoUndefinedVariablesChecker,
+        schema,
+        """
+        query Foo {
+            ...FragA
+        }
+        fragment FragB on Type {
+            ...FragC
+        }
+        fragment FragA on Type {
+            ...FragB
+        }
+        fragment FragC on Type {
+            field(a: $a)
+        }
+        """,
+        [
+            'Variable "$a" from fragment "FragC" is not defined on "Foo" operation'
+        ],
+    )
@@ -243,3 +243,24 @@ def test_variable_not_used_by_fragment_used_by_other_operation(schema):
         """,
         ['Unused variable "$b"', 'Unused variable "$a"'],
     )
+
+
+def test_uses_all_variables_in_fragments_defined_out_of_order(schema):
+    run_test(
+        NoUnusedVariablesChecker,
+        schema,
+        """
+        query Foo($a: String) {
+            ...FragA
+        }
+        fragment FragB on Type {
+            ...FragC
+        }
+        fragment FragA on Type {
+            ...FragB
+        }
+        fragment FragC on Type {
+            field(a: $a)
+        }
+        """,
+    )
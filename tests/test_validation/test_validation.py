@@ -3,6 +3,8 @@
 Test default validation.
 """
 
+from py_gql.validation import ValidationVisitor
+
 from ._test_utils import assert_validation_result
 
 
@@ -161,3 +163,24 @@ def test_allows_object_fields_in_inline_fragments(starwars_schema):
         }
         """,
     )
+
+
+def test_validators_overriding_enter_are_still_run(schema):
+    class CountFields(ValidationVisitor):
+        def enter(self, node):
+            if type(node).__name__ == "Field":
+                self.add_error("field")
+            return node
+
+    assert_validation_result(
+        schema,
+        """
+        query {
+            dog {
+                name
+            }
+        }
+        """,
+        ["field", "field"],
+        checkers=[CountFields],
+    )